@@ -1,12 +1,18 @@
 # backend.py
 from __future__ import annotations
 
-from typing import List, Optional, Set, Tuple
+import time
+from typing import FrozenSet, List, Optional, Tuple
 
 import pulsectl
 
 from models import AudioNode
-from pw_cli import pw_link_connect, pw_link_disconnect
+from pw_cli import (
+    pw_link_connect,
+    pw_link_connect_many,
+    pw_link_disconnect,
+    pw_link_disconnect_many,
+)
 from pw_dump import dump_graph
 from pw_graph import (
     is_internal_node,
@@ -33,18 +39,147 @@ class PipeWireHubBackend:
         self._hub_pulse_module_id: Optional[int] = None
         self._graph: PwGraph = PwGraph(nodes={}, ports={}, links=[])
 
-        self.refresh()
+        # The graph snapshot is memoized: repeated refresh() calls within the
+        # TTL window reuse the last pw-dump parse, and our own mutations
+        # invalidate the stamp so the next call re-dumps.
+        self._graph_stamp: float = 0.0
+        self._graph_ttl: float = 0.1
+
+        # Links we created/destroyed since the snapshot was taken. They are
+        # overlaid on the snapshot's pair set so link-state queries stay
+        # accurate without forcing an immediate re-dump.
+        self._pending_added: set = set()
+        self._pending_removed: set = set()
+
+        # Bumped whenever the effective pair set can change (re-dump or one
+        # of our own edits); pairs_exist memoizes per serial so the periodic
+        # UI reconcile does one set check per row set, not per poll.
+        self._graph_serial: int = 0
+        self._pairs_cache: dict = {}
+        self._pairs_cache_serial: int = -1
+
+        # Categorized views of the current snapshot, rebuilt per dump.
+        self._stream_nodes: List[AudioNode] = []
+        self._source_nodes: List[AudioNode] = []
+        self._sink_nodes: List[AudioNode] = []
+
+        # Per-snapshot query caches, cleared when a new graph is adopted.
+        self._channel_count_cache: dict = {}
+        self._monitor_ports_cache: dict = {}
+        self._hub_monitor_cache: Optional[List[PwPort]] = None
+
+        self.refresh(force=True)
         self.ensure_hub_sink()
 
-    def refresh(self) -> None:
-        self._graph = dump_graph()
+    def refresh(self, force: bool = False) -> None:
+        if not force and (time.monotonic() - self._graph_stamp) < self._graph_ttl:
+            return
+        self.adopt_snapshot(dump_graph())
+
+    def _categorize_nodes(self) -> None:
+        # One classification pass per dump; the list_* accessors are called
+        # several times per UI rebuild and would otherwise redo these
+        # media-class checks each time.
+        streams: List[AudioNode] = []
+        sources: List[AudioNode] = []
+        sinks: List[AudioNode] = []
+        hub_monitor_name = f"{self.HUB_SINK_NAME}.monitor"
+
+        for n in self._graph.nodes.values():
+            if is_stream_node(n):
+                if not is_internal_node(n):
+                    streams.append(n)
+            elif is_sink_node(n):
+                sinks.append(n)
+            elif is_source_node(n):
+                if not is_monitor_node(n) and n.name != hub_monitor_name:
+                    sources.append(n)
+
+        self._stream_nodes = streams
+        self._source_nodes = sources
+        self._sink_nodes = sinks
+
+    def _invalidate(self) -> None:
+        self._graph_stamp = 0.0
+
+    def snapshot(self) -> PwGraph:
+        """Parse a fresh dump without touching backend state.
+
+        Safe to call from a worker thread; hand the result back to the GUI
+        thread via adopt_snapshot().
+        """
+        return dump_graph()
+
+    def adopt_snapshot(self, graph: PwGraph) -> None:
+        self._graph_stamp = time.monotonic()
+        # dump_graph returns the identical object while the raw dump bytes
+        # are unchanged; in that case the snapshot (and any of our pending
+        # edits not yet reflected in it) stays as-is and the revision holds,
+        # so derived caches stay warm.
+        if graph is self._graph:
+            return
+        self._graph = graph
+        self._pending_added.clear()
+        self._pending_removed.clear()
+        self._graph_serial += 1
+        self._channel_count_cache.clear()
+        self._monitor_ports_cache.clear()
+        self._hub_monitor_cache = None
+        self._categorize_nodes()
+
+    def _note_links_added(self, pairs: LinkPairs) -> None:
+        self._pending_added.update(pairs)
+        self._pending_removed.difference_update(pairs)
+        self._graph_serial += 1
+
+    def _note_links_removed(self, pairs: LinkPairs) -> None:
+        self._pending_removed.update(pairs)
+        self._pending_added.difference_update(pairs)
+        self._graph_serial += 1
+
+    def revision(self) -> int:
+        """Serial of the current snapshot; changes whenever the graph can
+        have changed. Callers can key derived caches on it."""
+        return self._graph_serial
+
+    def snapshot_signature(self) -> int:
+        """Cheap content signature of the current graph snapshot.
+
+        Lets the UI detect "nothing changed" without comparing whole node
+        lists; it hashes identity-bearing node fields, the port topology
+        and the link set from the cached dump. Ports matter on their own:
+        a sink's monitor ports can arrive in a later dump than the node
+        itself, and that has to invalidate the UI's skip.
+        """
+        self.refresh()
+        g = self._graph
+        return hash((
+            tuple((n.id, n.name, n.description, n.media_class) for n in g.nodes.values()),
+            tuple(sorted(
+                (nid, d, tuple(p.channel for p in ps))
+                for (nid, d), ps in g.ports_by_node_dir.items()
+            )),
+            g.link_name_pairs,
+        ))
 
     def server_label(self) -> str:
         return "PipeWire (native graph)"
 
     def _pulse_connect(self) -> pulsectl.Pulse:
-        if self._pulse is None:
-            self._pulse = pulsectl.Pulse(self._pulse_client_name)
+        if self._pulse is not None:
+            # Cheap ping: a handle left over from a pipewire-pulse restart
+            # would otherwise fail every subsequent operation. Drop it and
+            # reconnect once instead.
+            try:
+                self._pulse.server_info()
+                return self._pulse
+            except Exception:
+                try:
+                    self._pulse.close()
+                except Exception:
+                    pass
+                self._pulse = None
+        self._pulse = pulsectl.Pulse(self._pulse_client_name)
         return self._pulse
 
     def close(self) -> None:
@@ -56,37 +191,45 @@ class PipeWireHubBackend:
         self._pulse = None
 
     def _find_node_by_name(self, name: str) -> Optional[AudioNode]:
-        for n in self._graph.nodes.values():
-            if n.name == name:
-                return n
-        return None
+        return self._graph.nodes_by_name.get(name)
 
     def _node_channel_count(self, node_id: int, direction: str) -> int:
-        ps = select_ports(self._graph, node_id, direction)
-        chans = [p.channel for p in ps if p.channel]
-        return len(set(chans)) if chans else len(ps)
+        key = (node_id, direction)
+        count = self._channel_count_cache.get(key)
+        if count is None:
+            ps = select_ports(self._graph, node_id, direction)
+            chans = {p.channel for p in ps if p.channel}
+            count = len(chans) if chans else len(ps)
+            self._channel_count_cache[key] = count
+        return count
+
+    def _get_hub_node(self, force_refresh: bool = False) -> Optional[AudioNode]:
+        # Single home for the refresh + name lookup + sink check triple that
+        # every hub accessor needs.
+        self.refresh(force=force_refresh)
+        hub = self._find_node_by_name(self.HUB_SINK_NAME)
+        if hub is not None and is_sink_node(hub):
+            return hub
+        return None
 
     def hub_exists(self) -> bool:
-        self.refresh()
-        hub = self._find_node_by_name(self.HUB_SINK_NAME)
-        return bool(hub is not None and is_sink_node(hub))
+        return self._get_hub_node() is not None
 
     def hub_node_optional(self) -> Optional[AudioNode]:
-        self.refresh()
-        hub = self._find_node_by_name(self.HUB_SINK_NAME)
-        if hub is None or not is_sink_node(hub):
-            return None
-        return hub
+        return self._get_hub_node()
 
     def ensure_hub_sink(self) -> None:
-        self.refresh()
-        hub = self._find_node_by_name(self.HUB_SINK_NAME)
-        if hub is not None and is_sink_node(hub):
+        if self._get_hub_node() is not None:
             return
 
         try:
             pulse = self._pulse_connect()
-            existing = next((s for s in pulse.sink_list() if s.name == self.HUB_SINK_NAME), None)
+            # Targeted query instead of marshalling every sink over the
+            # pulse socket just to scan for one name.
+            try:
+                existing = pulse.get_sink_by_name(self.HUB_SINK_NAME)
+            except pulsectl.PulseIndexError:
+                existing = None
             if existing is None:
                 args = " ".join(
                     [
@@ -100,9 +243,8 @@ class PipeWireHubBackend:
         except Exception as e:
             raise RuntimeError(f"Failed to ensure hub sink via pipewire-pulse: {e}") from e
 
-        self.refresh()
-        hub = self._find_node_by_name(self.HUB_SINK_NAME)
-        if hub is None or not is_sink_node(hub):
+        self._invalidate()
+        if self._get_hub_node() is None:
             raise RuntimeError("Hub sink was created via Pulse, but is not visible in PipeWire graph.")
 
     def destroy_hub_sink(self) -> None:
@@ -123,14 +265,14 @@ class PipeWireHubBackend:
 
         if pulse is not None and not unloaded:
             try:
-                target = next((s for s in pulse.sink_list() if s.name == self.HUB_SINK_NAME), None)
-                if target is not None:
-                    owner = getattr(target, "owner_module", None)
-                    if owner is not None:
-                        pulse.module_unload(int(owner))
+                target = pulse.get_sink_by_name(self.HUB_SINK_NAME)
+                owner = getattr(target, "owner_module", None)
+                if owner is not None:
+                    pulse.module_unload(int(owner))
             except Exception:
                 pass
 
+        self._invalidate()
         self.refresh()
 
     def destroy_hub_sink_if_owned(self) -> None:
@@ -141,45 +283,38 @@ class PipeWireHubBackend:
         except Exception:
             pass
         self._hub_pulse_module_id = None
+        self._invalidate()
         self.refresh()
 
     def hub_node(self) -> AudioNode:
-        self.refresh()
-        hub = self._find_node_by_name(self.HUB_SINK_NAME)
+        hub = self._get_hub_node()
         if hub is None:
             raise RuntimeError("Hub sink is missing.")
         return hub
 
     def hub_monitor_ports(self) -> List[PwPort]:
+        # Queried once per output connect; cached for the snapshot's lifetime
+        # like the per-sink monitor ports below.
         hub = self.hub_node()
+        if self._hub_monitor_cache is not None:
+            return self._hub_monitor_cache
+
         outs = select_ports(self._graph, hub.id, "out")
-        mons = [p for p in outs if p.port_name.startswith("monitor_") or p.port_name.startswith("monitor.")]
-        return mons if mons else outs
+        mons = [p for p in outs if p.port_name.startswith(("monitor_", "monitor."))]
+        self._hub_monitor_cache = mons if mons else outs
+        return self._hub_monitor_cache
 
     def list_stream_nodes(self) -> List[AudioNode]:
         self.refresh()
-        out: List[AudioNode] = []
-        for n in self._graph.nodes.values():
-            if is_stream_node(n) and not is_internal_node(n):
-                out.append(n)
-        return out
+        return self._stream_nodes
 
     def list_source_nodes(self) -> List[AudioNode]:
         self.refresh()
-        out: List[AudioNode] = []
-        for n in self._graph.nodes.values():
-            if not is_source_node(n):
-                continue
-            if is_monitor_node(n):
-                continue
-            if n.name == f"{self.HUB_SINK_NAME}.monitor":
-                continue
-            out.append(n)
-        return out
+        return self._source_nodes
 
     def list_sink_nodes(self) -> List[AudioNode]:
         self.refresh()
-        return [n for n in self._graph.nodes.values() if is_sink_node(n)]
+        return self._sink_nodes
 
     def stream_label(self, n: AudioNode) -> str:
         app = n.props.get("application.name") or n.props.get("application.process.binary") or "App"
@@ -193,34 +328,48 @@ class PipeWireHubBackend:
         return f"{desc}  [{n.name}]  ({ch}ch)"
 
     def _connect_pairs(self, pairs: LinkPairs) -> None:
-        for o, i in pairs:
-            pw_link_connect(o, i)
+        # Diff against the known link set first: a repeated connect click
+        # then spawns no subprocess at all, and partial re-connects only
+        # issue the missing links.
+        existing = self.current_link_pairs()
+        todo = [p for p in pairs if p not in existing]
+        if todo:
+            pw_link_connect_many(todo)
+        self._note_links_added(pairs)
 
     def _disconnect_pairs(self, pairs: LinkPairs) -> None:
-        for o, i in pairs:
-            pw_link_disconnect(o, i)
+        existing = self.current_link_pairs()
+        todo = [p for p in pairs if p in existing]
+        if todo:
+            pw_link_disconnect_many(todo)
+        self._note_links_removed(pairs)
 
-    def current_link_pairs(self, refresh: bool = False) -> Set[Tuple[str, str]]:
+    def current_link_pairs(self, refresh: bool = False) -> FrozenSet[Tuple[str, str]]:
         if refresh:
             self.refresh()
-        out: Set[Tuple[str, str]] = set()
-        for lk in self._graph.links:
-            op = self._graph.ports.get(lk.out_port_id)
-            ip = self._graph.ports.get(lk.in_port_id)
-            if not op or not ip or not op.full_name or not ip.full_name:
-                continue
-            out.add((op.full_name, ip.full_name))
-        return out
+        if not self._pending_added and not self._pending_removed:
+            return self._graph.link_name_pairs
+        return frozenset((self._graph.link_name_pairs | self._pending_added) - self._pending_removed)
 
     def pairs_exist(self, pairs: LinkPairs, refresh: bool = False) -> bool:
         if not pairs:
             return False
-        existing = self.current_link_pairs(refresh=refresh)
-        return all(p in existing for p in pairs)
+        if refresh:
+            self.refresh()
+
+        if self._pairs_cache_serial != self._graph_serial:
+            self._pairs_cache.clear()
+            self._pairs_cache_serial = self._graph_serial
+
+        key = tuple(pairs)
+        hit = self._pairs_cache.get(key)
+        if hit is None:
+            hit = self.current_link_pairs().issuperset(pairs)
+            self._pairs_cache[key] = hit
+        return hit
 
     def connect_stream_to_hub(self, stream_node_id: int) -> LinkPairs:
         self.ensure_hub_sink()
-        self.refresh()
         hub = self.hub_node()
 
         src_out = select_ports(self._graph, stream_node_id, "out")
@@ -236,7 +385,6 @@ class PipeWireHubBackend:
 
     def connect_source_to_hub(self, source_node_id: int) -> LinkPairs:
         self.ensure_hub_sink()
-        self.refresh()
         hub = self.hub_node()
 
         src_out = select_ports(self._graph, source_node_id, "out")
@@ -252,12 +400,21 @@ class PipeWireHubBackend:
 
     def _sink_monitor_output_ports(self, sink_node_id: int) -> List[PwPort]:
         self.refresh()
+        cached = self._monitor_ports_cache.get(sink_node_id)
+        if cached is not None:
+            return cached
+
+        ports = self._compute_sink_monitor_ports(sink_node_id)
+        self._monitor_ports_cache[sink_node_id] = ports
+        return ports
+
+    def _compute_sink_monitor_ports(self, sink_node_id: int) -> List[PwPort]:
         sink = self._graph.nodes.get(sink_node_id)
         if sink is None:
             return []
 
         outs = select_ports(self._graph, sink.id, "out")
-        mons = [p for p in outs if p.port_name.startswith("monitor_") or p.port_name.startswith("monitor.")]
+        mons = [p for p in outs if p.port_name.startswith(("monitor_", "monitor."))]
         if mons:
             return mons
 
@@ -268,7 +425,6 @@ class PipeWireHubBackend:
 
     def connect_sink_tap_to_hub(self, sink_node_id: int) -> LinkPairs:
         self.ensure_hub_sink()
-        self.refresh()
         hub = self.hub_node()
 
         if sink_node_id == hub.id:
@@ -287,7 +443,6 @@ class PipeWireHubBackend:
 
     def connect_hub_to_sink(self, sink_node_id: int) -> LinkPairs:
         self.ensure_hub_sink()
-        self.refresh()
         hub = self.hub_node()
 
         if sink_node_id == hub.id:
@@ -1,14 +1,29 @@
 # main_window.py
 from __future__ import annotations
 
+import logging
 import os
 import shutil
-import subprocess
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QProcess,
+    QRect,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -35,6 +50,13 @@ from store_config import ConfigStore, find_resink_executable_path
 from widgets import StatusPill
 
 
+@lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    # PATH rarely changes at runtime; no need to stat every entry per click.
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=4)
 def _help_html(app_name: str) -> str:
     return wrap_help_html(
         f"{app_name} — Help / About",
@@ -82,7 +104,39 @@ def _help_html(app_name: str) -> str:
     )
 
 
+_log = logging.getLogger(__name__)
+
+
+class _RefreshSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _RefreshWorker(QRunnable):
+    """Runs the pw-dump parse off the GUI thread.
+
+    The worker only produces a detached snapshot; the GUI thread adopts it
+    via a queued signal, so backend state is never touched concurrently.
+    """
+
+    def __init__(self, backend: PipeWireHubBackend, signals: _RefreshSignals) -> None:
+        super().__init__()
+        self._backend = backend
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            graph = self._backend.snapshot()
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.finished.emit(graph)
+
+
 class MainWindow(QMainWindow):
+    REFRESH_INTERVAL_MS = 1200
+    REFRESH_INTERVAL_MAX_MS = 8000
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle(APP_NAME)
@@ -94,6 +148,7 @@ class MainWindow(QMainWindow):
 
         self._build_ui()
         self._wire_timers()
+        self._wire_graph_monitor()
 
         self.add_input_row()
         self.add_output_row()
@@ -106,10 +161,30 @@ class MainWindow(QMainWindow):
     def _init_backend(self) -> None:
         self.backend = PipeWireHubBackend()
         self._input_choices: List[InputChoice] = []
+        self._input_groups: tuple = ([], [], [])
         self._output_choices: List[OutputChoice] = []
+        self._input_choices_sig: tuple = ()
+        self._output_choices_sig: tuple = ()
+        self._choices_rev = -1
+        self._sink_tap_cache: dict = {}
+        # Row widgets are tracked here so row iteration doesn't have to
+        # walk layout items and isinstance-check every child.
+        self._input_rows: List[InputRow] = []
+        self._output_rows: List[OutputRow] = []
         self._hub_desired_present: bool | None = None
+        self._last_snapshot_sig: Optional[int] = None
+        self._refresh_in_progress = False
+        # Consecutive refresh failures; drives the degraded-backend backoff
+        # so a broken pw-dump isn't hot-retried every 1.2 s.
+        self._fail_streak = 0
+        self._last_fail_log = 0.0
+        self._hub_ui_state: Optional[tuple] = None
+        # Per-refresh-cycle cache for hub lookups; several consumers ask for
+        # the hub node during one pass.
+        self._hub_cache: dict = {}
 
     def _init_updater(self) -> None:
+        self._help_dialog: Optional[HelpDialog] = None
         self._project = project_from_repo(
             REPO_URL,
             version=detect_version(),
@@ -117,9 +192,24 @@ class MainWindow(QMainWindow):
             settings_org="Retzilience",
             settings_app=APP_NAME,
         )
-        self._updater = UpdateClient(self, self._project)
+        # Constructed on demand; nothing needs the update client (or its
+        # network machinery) until the help dialog opens.
+        self._updater: Optional[UpdateClient] = None
+
+    def _get_updater(self) -> UpdateClient:
+        if self._updater is None:
+            self._updater = UpdateClient(self, self._project)
+        return self._updater
 
     def _build_ui(self) -> None:
+        # All output combos show the same sink list, so they share one model
+        # that _update_output_model rewrites once per change. Input combos
+        # share a model the same way, headers and separators included.
+        self._output_model = QStandardItemModel(self)
+        self._output_key_to_index: dict = {}
+        self._input_model = QStandardItemModel(self)
+        self._input_key_to_index: dict = {}
+
         root = QWidget()
         outer = QVBoxLayout()
         outer.setContentsMargins(12, 12, 12, 12)
@@ -183,22 +273,68 @@ class MainWindow(QMainWindow):
         body.addWidget(self.hub_panel, 2)
         body.addWidget(self.outputs_panel, 3)
 
+        # Rows skipped while scrolled out of view are refreshed as soon as
+        # scrolling brings them back in.
+        self.inputs_list.verticalScrollBar().valueChanged.connect(self._flush_pending_rows)
+        self.outputs_list.verticalScrollBar().valueChanged.connect(self._flush_pending_rows)
+
         return body
 
     def _wire_timers(self) -> None:
         self.timer = QTimer(self)
-        self.timer.setInterval(1200)
+        # Polling doesn't need millisecond precision; a coarse timer lets the
+        # OS coalesce wakeups instead of bumping the system tick rate.
+        self.timer.setTimerType(Qt.CoarseTimer)
+        self.timer.setInterval(self.REFRESH_INTERVAL_MS)
         self.timer.timeout.connect(self.refresh_streams_only)
         self.timer.start()
 
+        self._refresh_signals = _RefreshSignals()
+        self._refresh_signals.finished.connect(self._on_refresh_snapshot)
+        self._refresh_signals.failed.connect(self._on_refresh_failed)
+
+    def _wire_graph_monitor(self) -> None:
+        # Event-driven nudge: pw-mon streams registry events, so any output
+        # means the graph changed and a refresh is scheduled right away
+        # (coalesced over 120 ms to ride out event bursts). The polling
+        # timer stays as the fallback when pw-mon is unavailable.
+        self._mon: Optional[QProcess] = None
+        if shutil.which("pw-mon") is None:
+            return
+
+        self._mon_coalesce = QTimer(self)
+        self._mon_coalesce.setSingleShot(True)
+        self._mon_coalesce.setInterval(120)
+        self._mon_coalesce.timeout.connect(self._on_graph_event)
+
+        proc = QProcess(self)
+        proc.setProcessChannelMode(QProcess.MergedChannels)
+        proc.readyReadStandardOutput.connect(self._on_mon_output)
+        proc.start("pw-mon", [])
+        self._mon = proc
+
+    def _on_mon_output(self) -> None:
+        if self._mon is not None:
+            self._mon.readAllStandardOutput()  # content irrelevant, drain it
+        self._mon_coalesce.start()
+
+    def _on_graph_event(self) -> None:
+        self.timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_streams_only()
+
     def _open_help(self) -> None:
-        dlg = HelpDialog(
-            self,
-            self._project,
-            html=_help_html(self._project.name or self._project.repo),
-            updater=self._updater,
-        )
-        dlg.exec()
+        # Built once and reused; repeat opens skip the dialog construction
+        # and the QTextDocument HTML re-parse.
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(
+                self,
+                self._project,
+                html=_help_html(self._project.name or self._project.repo),
+                updater=self._get_updater(),
+            )
+        self._help_dialog.show()
+        self._help_dialog.raise_()
+        self._help_dialog.activateWindow()
 
     def _make_panel(self, title: str, add_label: str, add_cb) -> QFrame:
         frame = QFrame()
@@ -325,42 +461,48 @@ class MainWindow(QMainWindow):
         self._update_hub_controls()
 
     def _update_hub_controls(self) -> None:
-        actual = self.backend.hub_exists()
+        actual = self._hub_exists()
         desired = self._hub_desired_present
 
         if desired is None:
             if actual:
-                self.hub_status.setText("On")
-                self.hub_status.set_state("on")
-                self.hub_status.setToolTip("Hub sink exists.")
-                self.hub_btn.setText("Destroy aSyphon sink")
-                self.hub_btn.setObjectName("Danger")
+                state = ("On", "on", "Hub sink exists.",
+                         "Destroy aSyphon sink", "Danger")
             else:
-                self.hub_status.setText("Off")
-                self.hub_status.set_state("off")
-                self.hub_status.setToolTip("Hub sink does not exist.")
-                self.hub_btn.setText("Create aSyphon sink")
-                self.hub_btn.setObjectName("Primary")
+                state = ("Off", "off", "Hub sink does not exist.",
+                         "Create aSyphon sink", "Primary")
+        elif desired:
+            state = ("Pending", "pending", "Hub sink missing; pending create (Apply to commit).",
+                     "Create aSyphon sink", "PendingAction")
         else:
-            self.hub_status.setText("Pending")
-            self.hub_status.set_state("pending")
-            if desired:
-                self.hub_status.setToolTip("Hub sink missing; pending create (Apply to commit).")
-                self.hub_btn.setText("Create aSyphon sink")
-            else:
-                self.hub_status.setToolTip("Hub sink exists; pending destroy (Apply to commit).")
-                self.hub_btn.setText("Destroy aSyphon sink")
-            self.hub_btn.setObjectName("PendingAction")
+            state = ("Pending", "pending", "Hub sink exists; pending destroy (Apply to commit).",
+                     "Destroy aSyphon sink", "PendingAction")
+
+        # Re-polishing the button re-parses stylesheet rules; this runs on
+        # every tick, so skip it entirely when nothing changed.
+        if state == self._hub_ui_state:
+            return
+        self._hub_ui_state = state
+
+        pill_text, pill_state, tooltip, btn_text, btn_obj = state
+        self.hub_status.setText(pill_text)
+        self.hub_status.set_state(pill_state)
+        self.hub_status.setToolTip(tooltip)
+        self.hub_btn.setText(btn_text)
+        self.hub_btn.setObjectName(btn_obj)
 
         self.hub_btn.style().unpolish(self.hub_btn)
         self.hub_btn.style().polish(self.hub_btn)
 
     def _apply_hub_create_if_needed(self) -> None:
-        if self._hub_desired_present is True:
-            try:
-                self.backend.ensure_hub_sink()
-            except Exception:
-                pass
+        if self._hub_desired_present is not True:
+            return
+        if self.backend.hub_exists():
+            return
+        try:
+            self.backend.ensure_hub_sink()
+        except Exception:
+            pass
 
     def _input_container_layout(self):
         return self.inputs_list._layout  # type: ignore[attr-defined]
@@ -369,36 +511,29 @@ class MainWindow(QMainWindow):
         return self.outputs_list._layout  # type: ignore[attr-defined]
 
     def input_rows(self) -> List[InputRow]:
-        lay = self._input_container_layout()
-        out: List[InputRow] = []
-        for i in range(lay.count()):
-            w = lay.itemAt(i).widget()
-            if isinstance(w, InputRow):
-                out.append(w)
-        return out
+        return list(self._input_rows)
 
     def output_rows(self) -> List[OutputRow]:
-        lay = self._output_container_layout()
-        out: List[OutputRow] = []
-        for i in range(lay.count()):
-            w = lay.itemAt(i).widget()
-            if isinstance(w, OutputRow):
-                out.append(w)
-        return out
+        return list(self._output_rows)
 
     def add_input_row(self) -> None:
         row = InputRow()
+        with QSignalBlocker(row.combo):
+            row.combo.setModel(self._input_model)
+            if self._input_key_to_index:
+                row.combo.setCurrentIndex(min(self._input_key_to_index.values()))
         row.remove_requested.connect(self.remove_input_row)
         lay = self._input_container_layout()
         lay.insertWidget(lay.count() - 1, row)
-        self._populate_input_combo(row)
+        self._input_rows.append(row)
 
     def add_output_row(self) -> None:
         row = OutputRow()
+        row.combo.setModel(self._output_model)
         row.remove_requested.connect(self.remove_output_row)
         lay = self._output_container_layout()
         lay.insertWidget(lay.count() - 1, row)
-        self._populate_output_combo(row)
+        self._output_rows.append(row)
 
     def remove_input_row(self, w: QWidget) -> None:
         if isinstance(w, InputRow):
@@ -410,53 +545,153 @@ class MainWindow(QMainWindow):
 
     def _finalize_row_removals(self, widgets: List[QWidget]) -> None:
         for w in widgets:
+            if w in self._input_rows:
+                self._input_rows.remove(w)
+            elif w in self._output_rows:
+                self._output_rows.remove(w)
             w.setParent(None)
             w.deleteLater()
 
+    def _row_is_visible(self, row: QWidget, scroll: QScrollArea) -> bool:
+        vp = scroll.viewport()
+        return vp.rect().intersects(QRect(row.mapTo(vp, row.rect().topLeft()), row.size()))
+
+    def _flush_pending_rows(self) -> None:
+        for r in self._input_rows:
+            if getattr(r, "_pending_refresh", False) and self._row_is_visible(r, self.inputs_list):
+                r.reconcile(self.backend)
+                r._pending_refresh = False
+        for r in self._output_rows:
+            if getattr(r, "_pending_refresh", False) and self._row_is_visible(r, self.outputs_list):
+                r.reconcile(self.backend)
+                r._pending_refresh = False
+
+    def _hub(self):
+        if "hub" not in self._hub_cache:
+            self._hub_cache["hub"] = self.backend.hub_node_optional()
+        return self._hub_cache["hub"]
+
+    def _hub_exists(self) -> bool:
+        return self._hub() is not None
+
+    @contextmanager
+    def _batched_updates(self):
+        # One repaint for a whole refresh/apply pass instead of one per
+        # mutated child widget.
+        w = self.centralWidget()
+        w.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            w.setUpdatesEnabled(True)
+            w.update()
+
+    @contextmanager
+    def _frozen_viewports(self):
+        # Row combo refills dirty the surrounding scroll areas; freezing the
+        # viewports keeps a whole row pass to one paint per list.
+        vps = (self.inputs_list.viewport(), self.outputs_list.viewport())
+        for vp in vps:
+            vp.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for vp in vps:
+                vp.setUpdatesEnabled(True)
+
     def refresh_streams_only(self) -> None:
         if not self.auto_refresh.isChecked():
             return
-        try:
-            self.backend.refresh()
-            self._rebuild_choices()
+        if self._refresh_in_progress:
+            return
+        if self.isMinimized() or not self.isVisible():
+            return
 
-            for r in self.input_rows():
-                self._populate_input_combo(r)
-            for r in self.output_rows():
-                self._populate_output_combo(r)
+        # The dump+parse happens on a pool thread; the snapshot comes back
+        # through a queued signal and the UI update runs in
+        # _on_refresh_snapshot on the GUI thread.
+        self._refresh_in_progress = True
+        QThreadPool.globalInstance().start(_RefreshWorker(self.backend, self._refresh_signals))
+
+    def _refresh_failure(self, err: str) -> None:
+        # Back off exponentially while the backend stays broken, and surface
+        # the failure once in a while instead of swallowing it every tick.
+        self._fail_streak += 1
+        self.timer.setInterval(
+            min(self.REFRESH_INTERVAL_MS * (1 << self._fail_streak), self.REFRESH_INTERVAL_MAX_MS)
+        )
+        now = time.monotonic()
+        if now - self._last_fail_log >= 30.0:
+            self._last_fail_log = now
+            _log.warning("refresh failed (streak %d): %s", self._fail_streak, err)
 
-            for r in self.input_rows():
-                r.reconcile(self.backend)
-            for r in self.output_rows():
-                r.reconcile(self.backend)
+    def _on_refresh_failed(self, err: str) -> None:
+        self._refresh_failure(err)
+        self._refresh_in_progress = False
 
-            self._update_hub_controls()
-            self._update_hub_info()
-        except Exception:
-            pass
+    def _on_refresh_snapshot(self, graph: object) -> None:
+        try:
+            self.backend.adopt_snapshot(graph)
+            self._fail_streak = 0
+            self._hub_cache.clear()
+
+            # Steady-state ticks are no-ops: when the graph signature hasn't
+            # moved there is nothing to rebuild, and the poll interval backs
+            # off so an idle desktop isn't charged 1.2 s refresh cycles.
+            sig = self.backend.snapshot_signature()
+            if sig == self._last_snapshot_sig:
+                self.timer.setInterval(min(self.timer.interval() * 2, self.REFRESH_INTERVAL_MAX_MS))
+                return
+            self._last_snapshot_sig = sig
+            self.timer.setInterval(self.REFRESH_INTERVAL_MS)
+
+            with self._batched_updates():
+                self._rebuild_choices()
+
+                # Off-screen rows are deferred; the scrollbar hook refreshes
+                # them when they come into view.
+                reconcile_sig = (self.backend.revision(), self._hub_desired_present)
+                with self._frozen_viewports():
+                    for r in self.input_rows():
+                        if self._row_is_visible(r, self.inputs_list):
+                            r.reconcile(self.backend, reconcile_sig)
+                            r._pending_refresh = False
+                        else:
+                            r._pending_refresh = True
+                    for r in self.output_rows():
+                        if self._row_is_visible(r, self.outputs_list):
+                            r.reconcile(self.backend, reconcile_sig)
+                            r._pending_refresh = False
+                        else:
+                            r._pending_refresh = True
+
+                self._update_hub_controls()
+                self._update_hub_info()
+        except Exception as e:
+            self._refresh_failure(str(e))
+        finally:
+            self._refresh_in_progress = False
 
     def refresh_everything(self) -> None:
         try:
-            self.backend.refresh()
-            self.server.setText(self.backend.server_label())
-            self._rebuild_choices()
-            self._update_hub_controls()
-            self._update_hub_info()
-
-            for r in self.input_rows():
-                self._populate_input_combo(r)
-            for r in self.output_rows():
-                self._populate_output_combo(r)
-
-            for r in self.input_rows():
-                r.reconcile(self.backend)
-            for r in self.output_rows():
-                r.reconcile(self.backend)
+            with self._batched_updates():
+                self.backend.refresh()
+                self._hub_cache.clear()
+                self.server.setText(self.backend.server_label())
+                self._rebuild_choices()
+                self._update_hub_controls()
+                self._update_hub_info()
+
+                with self._frozen_viewports():
+                    for r in self.input_rows():
+                        r.reconcile(self.backend)
+                    for r in self.output_rows():
+                        r.reconcile(self.backend)
         except Exception as e:
             QMessageBox.critical(self, "Backend error", str(e))
 
     def _update_hub_info(self) -> None:
-        hub = self.backend.hub_node_optional()
+        hub = self._hub()
         if hub is None:
             self.hub_info.setText("Hub sink does not exist.")
             return
@@ -468,160 +703,234 @@ class MainWindow(QMainWindow):
         )
 
     def _rebuild_choices(self) -> None:
+        # The choice lists are a pure function of the backend snapshot, so
+        # rebuilding is skipped while the revision is unchanged (e.g. the
+        # refresh_everything right after an apply_all pass).
+        rev = self.backend.revision()
+        if rev == self._choices_rev:
+            return
+        self._choices_rev = rev
+        self._sink_tap_cache.clear()
+
         streams = self.backend.list_stream_nodes()
         sources = self.backend.list_source_nodes()
         sinks = self.backend.list_sink_nodes()
 
-        hub = self.backend.hub_node_optional()
+        hub = self._hub()
         hub_id = hub.id if hub is not None else None
 
+        # The hub itself is never offered as a tap or an output, so filter
+        # and sort the sinks once and let both sink lists share the result.
+        non_hub_sinks = sorted(
+            (n for n in sinks if hub_id is None or n.id != hub_id),
+            key=attrgetter("sort_key"),
+        )
+
+        # Labels are computed once per node here; they are needed by both
+        # the sort keys and the choice displays (and sinks by two lists).
+        stream_labels = {n.id: self.backend.stream_label(n) for n in streams}
+        sink_in_labels = {n.id: self.backend.node_label_with_ch(n, "in") for n in non_hub_sinks}
+
         stream_choices = [
-            InputChoice(kind="stream", key=f"stream:{n.id}", display=self.backend.stream_label(n))
-            for n in sorted(streams, key=lambda x: self.backend.stream_label(x).lower())
+            InputChoice(kind="stream", key=f"stream:{n.id}", display=stream_labels[n.id])
+            for n in sorted(streams, key=lambda x: stream_labels[x.id].lower())
         ]
         source_choices = [
             InputChoice(kind="source", key=f"source:{n.id}", display=self.backend.node_label_with_ch(n, "out"))
-            for n in sorted(sources, key=lambda x: (x.description.lower(), x.name.lower()))
+            for n in sorted(sources, key=attrgetter("sort_key"))
         ]
 
         sink_choices: List[InputChoice] = []
-        for n in sorted(sinks, key=lambda x: (x.description.lower(), x.name.lower())):
-            if hub_id is not None and n.id == hub_id:
-                continue
-            try:
+        for n in non_hub_sinks:
+            # _sink_monitor_output_ports returns [] for a vanished node, so
+            # no per-sink exception handling is needed here.
+            tap = self._sink_tap_cache.get(n.id)
+            if tap is None:
                 tap = self.backend._sink_monitor_output_ports(n.id)
-            except Exception:
-                tap = []
+                self._sink_tap_cache[n.id] = tap
             if not tap:
                 continue
             sink_choices.append(
                 InputChoice(
                     kind="sink",
                     key=f"sink:{n.id}",
-                    display=f"Tap sink: {self.backend.node_label_with_ch(n, 'in')}",
+                    display=f"Tap sink: {sink_in_labels[n.id]}",
                 )
             )
 
         self._input_choices = stream_choices + source_choices + sink_choices
+        # The per-kind partition is what the input combos actually consume;
+        # share it instead of re-partitioning per row.
+        self._input_groups = (stream_choices, source_choices, sink_choices)
         self._output_choices = [
-            OutputChoice(key=f"sink:{n.id}", display=self.backend.node_label_with_ch(n, "in"))
-            for n in sorted(sinks, key=lambda x: (x.description.lower(), x.name.lower()))
-            if hub_id is None or n.id != hub_id
+            OutputChoice(key=f"sink:{n.id}", display=sink_in_labels[n.id])
+            for n in non_hub_sinks
         ]
 
-    def _populate_input_combo(self, row: InputRow) -> None:
-        prev = row.selected_choice()
-        prev_key = prev.key if prev else None
+        # Signatures of the item sets, so per-row populate calls can tell
+        # "combo already shows exactly this" and skip the rebuild.
+        self._input_choices_sig = tuple((c.kind, c.key, c.display) for c in self._input_choices)
+        self._output_choices_sig = tuple((c.key, c.display) for c in self._output_choices)
 
-        streams = [c for c in self._input_choices if c.kind == "stream"]
-        sources = [c for c in self._input_choices if c.kind == "source"]
-        sinks = [c for c in self._input_choices if c.kind == "sink"]
+        self._update_input_model()
+        self._update_output_model()
 
-        row.combo.blockSignals(True)
-        row.combo.clear()
-
-        def add_group(title: str, items: List[InputChoice]) -> None:
-            if not items:
-                return
-            row.combo.addItem(title, None)
-            row.combo.model().item(row.combo.count() - 1).setEnabled(False)  # type: ignore[attr-defined]
-            for it in items:
-                row.combo.addItem(it.display, it)
-            row.combo.insertSeparator(row.combo.count())
-
-        add_group("— App streams —", streams)
-        add_group("— Capture sources —", sources)
-        add_group("— Tap sinks (monitor) —", sinks)
-
-        if prev_key:
-            for i in range(row.combo.count()):
-                d = row.combo.itemData(i)
-                if isinstance(d, InputChoice) and d.key == prev_key:
-                    row.combo.setCurrentIndex(i)
-                    break
-        else:
-            for i in range(row.combo.count()):
-                if isinstance(row.combo.itemData(i), InputChoice):
-                    row.combo.setCurrentIndex(i)
-                    break
+    def _update_input_model(self) -> None:
+        if self._input_key_to_index and \
+                getattr(self, "_input_model_sig", None) == self._input_choices_sig:
+            return
+        self._input_model_sig = self._input_choices_sig
 
-        row.combo.blockSignals(False)
+        rows = self._input_rows
+        prev_keys = []
+        for r in rows:
+            c = r.selected_choice()
+            prev_keys.append(c.key if c is not None else None)
 
-    def _populate_output_combo(self, row: OutputRow) -> None:
-        prev_id = row.selected_sink_node_id()
-        prev_key = f"sink:{prev_id}" if prev_id is not None else None
+        # Rewriting the shared model resets every attached combo, so block
+        # their signals for the duration and restore selections afterwards.
+        blockers = [QSignalBlocker(r.combo) for r in rows]
+        try:
+            m = self._input_model
+            m.clear()
 
-        row.combo.blockSignals(True)
-        row.combo.clear()
+            # key -> model row, filled while adding, so restoring selections
+            # is a dict lookup instead of an itemData scan.
+            key_to_index: dict = {}
 
-        for c in self._output_choices:
-            row.combo.addItem(c.display, c.key)
+            def add_group(title: str, items: List[InputChoice]) -> None:
+                if not items:
+                    return
+                header = QStandardItem(title)
+                header.setEnabled(False)
+                m.appendRow(header)
+                for c in items:
+                    it = QStandardItem(c.display)
+                    it.setData(c, Qt.UserRole)
+                    m.appendRow(it)
+                    key_to_index[c.key] = m.rowCount() - 1
+                # The combo delegate renders this role value as a separator;
+                # it is what QComboBox.insertSeparator sets on its own model.
+                sep = QStandardItem()
+                sep.setData("separator", Qt.AccessibleDescriptionRole)
+                sep.setEnabled(False)
+                m.appendRow(sep)
+
+            streams, sources, sinks = self._input_groups
+            add_group("— App streams —", streams)
+            add_group("— Capture sources —", sources)
+            add_group("— Tap sinks (monitor) —", sinks)
+
+            self._input_key_to_index = key_to_index
+
+            for r, pk in zip(rows, prev_keys):
+                idx = key_to_index.get(pk, -1) if pk else -1
+                if idx < 0 and key_to_index:
+                    idx = min(key_to_index.values())
+                if idx >= 0:
+                    r.combo.setCurrentIndex(idx)
+        finally:
+            del blockers
+
+    def _update_output_model(self) -> None:
+        if self._output_key_to_index and \
+                getattr(self, "_output_model_sig", None) == self._output_choices_sig:
+            return
+        self._output_model_sig = self._output_choices_sig
 
-        if prev_key:
-            idx = row.combo.findData(prev_key)
-            if idx >= 0:
-                row.combo.setCurrentIndex(idx)
+        rows = self._output_rows
+        prev_keys = []
+        for r in rows:
+            pid = r.selected_sink_node_id()
+            prev_keys.append(f"sink:{pid}" if pid is not None else None)
 
-        row.combo.blockSignals(False)
+        # Rewriting the shared model resets every attached combo, so block
+        # their signals for the duration and restore selections afterwards.
+        blockers = [QSignalBlocker(r.combo) for r in rows]
+        try:
+            m = self._output_model
+            m.clear()
+            key_to_index: dict = {}
+            for i, c in enumerate(self._output_choices):
+                it = QStandardItem(c.display)
+                it.setData(c.key, Qt.UserRole)
+                m.appendRow(it)
+                key_to_index[c.key] = i
+            self._output_key_to_index = key_to_index
+
+            for r, pk in zip(rows, prev_keys):
+                idx = key_to_index.get(pk, -1) if pk else -1
+                if idx >= 0:
+                    r.combo.setCurrentIndex(idx)
+        finally:
+            del blockers
 
     def apply_all(self) -> None:
         errors: List[str] = []
         to_remove: List[QWidget] = []
 
         try:
-            self.backend.refresh()
-
-            for r in self.input_rows():
-                r.reconcile(self.backend)
-            for r in self.output_rows():
-                r.reconcile(self.backend)
+            with self._batched_updates():
+                self._apply_all_inner(errors, to_remove)
+        except Exception as e:
+            errors.append(str(e))
 
-            self._apply_hub_create_if_needed()
-            self.backend.refresh()
+        if errors:
+            QMessageBox.critical(self, "Apply issues", "\n".join(errors))
 
-            for r in self.input_rows():
-                try:
-                    if r.apply(self.backend):
-                        to_remove.append(r)
-                except Exception as e:
-                    errors.append(str(e))
+    def _apply_all_inner(self, errors: List[str], to_remove: List[QWidget]) -> None:
+        self.backend.refresh()
 
-            for r in self.output_rows():
-                try:
-                    if r.apply(self.backend):
-                        to_remove.append(r)
-                except Exception as e:
-                    errors.append(str(e))
+        for r in self.input_rows():
+            r.reconcile(self.backend)
+        for r in self.output_rows():
+            r.reconcile(self.backend)
 
-            if self._hub_desired_present is False:
-                try:
-                    self.backend.destroy_hub_sink()
-                except Exception:
-                    pass
+        # ensure_hub_sink/destroy_hub_sink re-dump internally, and link
+        # edits are overlaid on the cached snapshot, so no extra refreshes
+        # are needed between the steps below; the refresh_everything at the
+        # end takes the single authoritative re-dump.
+        self._apply_hub_create_if_needed()
 
-            if self._hub_desired_present is not None:
-                self._hub_desired_present = None
+        for r in self.input_rows():
+            try:
+                if r.apply(self.backend):
+                    to_remove.append(r)
+            except Exception as e:
+                errors.append(str(e))
 
-            self.backend.refresh()
+        for r in self.output_rows():
+            try:
+                if r.apply(self.backend):
+                    to_remove.append(r)
+            except Exception as e:
+                errors.append(str(e))
 
-            for r in self.input_rows():
-                r.reconcile(self.backend)
-            for r in self.output_rows():
-                r.reconcile(self.backend)
+        if self._hub_desired_present is False:
+            try:
+                self.backend.destroy_hub_sink()
+            except Exception:
+                pass
 
-            self._finalize_row_removals(to_remove)
-            self.refresh_everything()
+        if self._hub_desired_present is not None:
+            self._hub_desired_present = None
 
-        except Exception as e:
-            errors.append(str(e))
+        for r in self.input_rows():
+            r.reconcile(self.backend)
+        for r in self.output_rows():
+            r.reconcile(self.backend)
 
-        if errors:
-            QMessageBox.critical(self, "Apply issues", "\n".join(errors))
+        self._finalize_row_removals(to_remove)
+        self.refresh_everything()
 
     def _open_patchbay_settings(self) -> bool:
         try:
             dlg = PatchbaySettingsDialog(self.store, self)
-            return dlg.exec() == QDialog.DialogCode.Accepted
+            accepted = dlg.exec() == QDialog.DialogCode.Accepted
+            if accepted:
+                # The user may have just installed a patchbay; re-probe PATH.
+                _which.cache_clear()
+            return accepted
         except Exception as e:
             QMessageBox.warning(self, "Patchbay settings error", str(e))
             return False
@@ -652,10 +961,11 @@ class MainWindow(QMainWindow):
         return self._patchbay_is_configured(sel, custom)
 
     def _launch_process(self, cmd: List[str], *, title: str) -> None:
-        try:
-            subprocess.Popen(cmd, close_fds=True)
-        except Exception as e:
-            QMessageBox.warning(self, title, str(e))
+        # startDetached avoids forking the whole Python heap just to exec a
+        # helper app, and the child needs no reaping.
+        ok, _pid = QProcess.startDetached(cmd[0], cmd[1:])
+        if not ok:
+            QMessageBox.warning(self, title, f"Failed to launch: {cmd[0]}")
 
     def _open_patchbay(self) -> None:
         if not self._ensure_patchbay_configured():
@@ -665,13 +975,13 @@ class MainWindow(QMainWindow):
         cmd: Optional[List[str]] = None
 
         if sel == "qpwgraph":
-            if shutil.which("qpwgraph") is None:
+            if _which("qpwgraph") is None:
                 QMessageBox.warning(self, "Patchbay not available", "qpwgraph is not available in PATH.")
                 return
             cmd = ["qpwgraph"]
 
         elif sel == "helvum":
-            if shutil.which("helvum") is None:
+            if _which("helvum") is None:
                 QMessageBox.warning(self, "Patchbay not available", "helvum is not available in PATH.")
                 return
             cmd = ["helvum"]
@@ -701,6 +1011,10 @@ class MainWindow(QMainWindow):
             self._launch_process([p], title="Failed to launch reSink")
             return
 
+        # The user may install reSink after this miss; drop the cached
+        # (empty) detection so the next click re-probes.
+        find_resink_executable_path.cache_clear()
+
         q = QMessageBox.question(
             self,
             "reSink not found",
@@ -712,7 +1026,36 @@ class MainWindow(QMainWindow):
         if q == QMessageBox.Yes:
             open_url_external(RESINK_REPO_URL)
 
+    def hideEvent(self, event) -> None:
+        # No background polling while nobody is looking.
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event) -> None:
+        if not self.timer.isActive():
+            self.timer.start()
+            QTimer.singleShot(0, self.refresh_streams_only)
+        super().showEvent(event)
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            elif not self.timer.isActive():
+                self.timer.start()
+                self.refresh_streams_only()
+        super().changeEvent(event)
+
     def closeEvent(self, event) -> None:
+        if self._mon is not None:
+            try:
+                self._mon.readyReadStandardOutput.disconnect(self._on_mon_output)
+                self._mon.kill()
+                self._mon.waitForFinished(500)
+            except Exception:
+                pass
+            self._mon = None
+
         try:
             for r in self.input_rows():
                 r.disconnect_now(self.backend)
@@ -1,27 +1,32 @@
 # models.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioNode:
     id: int
     name: str
     description: str
     media_class: str
     props: Dict[str, str]
+    # Computed once per node; the choice lists sort on this repeatedly.
+    sort_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sort_key", (self.description.lower(), self.name.lower()))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InputChoice:
     kind: str   # "stream" | "source" | "sink"
     key: str    # "stream:<id>" | "source:<id>" | "sink:<id>"
     display: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputChoice:
     key: str    # "sink:<id>"
     display: str
@@ -1,8 +1,8 @@
 # patchbay_settings_dialog.py
 from __future__ import annotations
 
-import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -26,6 +26,13 @@ from store_config import ConfigStore, find_resink_executable_path
 RESINK_REPO_URL = "https://github.com/Retzilience/reSink"
 
 
+@lru_cache(maxsize=8)
+def _which(name: str) -> "str | None":
+    # PATH rarely changes while the app runs; don't re-stat every entry on
+    # each dialog open.
+    return shutil.which(name)
+
+
 class PatchbaySettingsDialog(QDialog):
     """
     I store patchbay preferences only.
@@ -38,7 +45,11 @@ class PatchbaySettingsDialog(QDialog):
         self.setMinimumSize(560, 260)
 
         self.store = store
-        self.cfg = self.store.load()
+        self.cfg = None
+        self._initial: "tuple[str, str] | None" = None
+        # Config load and filesystem probes are deferred to first show, so
+        # constructing the dialog stays cheap.
+        self._populated = False
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(12, 12, 12, 12)
@@ -59,14 +70,6 @@ class PatchbaySettingsDialog(QDialog):
         self.group.addButton(self.rb_helvum)
         self.group.addButton(self.rb_custom)
 
-        self.rb_qpw.setEnabled(shutil.which("qpwgraph") is not None)
-        if not self.rb_qpw.isEnabled():
-            self.rb_qpw.setToolTip("qpwgraph not found in PATH.")
-
-        self.rb_helvum.setEnabled(shutil.which("helvum") is not None)
-        if not self.rb_helvum.isEnabled():
-            self.rb_helvum.setToolTip("helvum not found in PATH.")
-
         form.addRow(QLabel("Preferred patchbay:"), QLabel(""))
         form.addRow(self.rb_qpw)
         form.addRow(self.rb_helvum)
@@ -98,6 +101,43 @@ class PatchbaySettingsDialog(QDialog):
 
         form.addRow(resink_row)
 
+        self.rb_custom.toggled.connect(self._sync_custom_enable)
+        self.rb_qpw.toggled.connect(self._sync_custom_enable)
+        self.rb_helvum.toggled.connect(self._sync_custom_enable)
+        self._sync_custom_enable()
+
+        btns = QHBoxLayout()
+        btns.setSpacing(8)
+
+        save_btn = QPushButton("Save")
+        save_btn.setObjectName("Primary")
+        save_btn.clicked.connect(self._save)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+
+        btns.addStretch(1)
+        btns.addWidget(save_btn)
+        btns.addWidget(cancel_btn)
+        outer.addLayout(btns)
+
+    def showEvent(self, ev) -> None:
+        if not self._populated:
+            self._populated = True
+            self._populate()
+        super().showEvent(ev)
+
+    def _populate(self) -> None:
+        self.cfg = self.store.load()
+
+        self.rb_qpw.setEnabled(_which("qpwgraph") is not None)
+        if not self.rb_qpw.isEnabled():
+            self.rb_qpw.setToolTip("qpwgraph not found in PATH.")
+
+        self.rb_helvum.setEnabled(_which("helvum") is not None)
+        if not self.rb_helvum.isEnabled():
+            self.rb_helvum.setToolTip("helvum not found in PATH.")
+
         self._resink_path = find_resink_executable_path()
         if self._resink_path and Path(self._resink_path).exists():
             self.resink_status.setText(f"Detected (from reSink config): {self._resink_path}")
@@ -111,6 +151,9 @@ class PatchbaySettingsDialog(QDialog):
 
         selected = (self.cfg.get("Patchbay", "selected_app", fallback="") or "").strip().lower()
         custom_path = (self.cfg.get("Patchbay", "custom_path", fallback="") or "").strip()
+        # Snapshot of what the config currently holds; _save skips the disk
+        # write when the user saves without changing anything.
+        self._initial = (selected, custom_path)
         if custom_path:
             self.custom_edit.setText(custom_path)
 
@@ -128,26 +171,8 @@ class PatchbaySettingsDialog(QDialog):
             else:
                 self.rb_custom.setChecked(True)
 
-        self.rb_custom.toggled.connect(self._sync_custom_enable)
-        self.rb_qpw.toggled.connect(self._sync_custom_enable)
-        self.rb_helvum.toggled.connect(self._sync_custom_enable)
         self._sync_custom_enable()
 
-        btns = QHBoxLayout()
-        btns.setSpacing(8)
-
-        save_btn = QPushButton("Save")
-        save_btn.setObjectName("Primary")
-        save_btn.clicked.connect(self._save)
-
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-
-        btns.addStretch(1)
-        btns.addWidget(save_btn)
-        btns.addWidget(cancel_btn)
-        outer.addLayout(btns)
-
     def _sync_custom_enable(self) -> None:
         self.custom_edit.setEnabled(self.rb_custom.isChecked())
 
@@ -177,12 +202,21 @@ class PatchbaySettingsDialog(QDialog):
             if not custom_path:
                 QMessageBox.warning(self, "Invalid path", "Custom path cannot be empty.")
                 return
-            if not os.path.exists(custom_path):
-                QMessageBox.warning(self, "Invalid path", "Custom path does not exist.")
+            # One stat, and directories are rejected too - only a file can
+            # be launched as the patchbay.
+            if not Path(custom_path).is_file():
+                QMessageBox.warning(self, "Invalid path", "Custom path is not an existing file.")
                 return
 
+        if (selected, custom_path) == self._initial:
+            # Nothing changed since the dialog loaded; no point rewriting
+            # the config file.
+            self.accept()
+            return
+
         self.cfg.set("Patchbay", "selected_app", selected)
         self.cfg.set("Patchbay", "custom_path", custom_path)
 
         self.store.save(self.cfg)
+        find_resink_executable_path.cache_clear()
         self.accept()
@@ -1,46 +1,76 @@
 # pw_channels.py
 from __future__ import annotations
 
+import re
+from sys import intern
 from typing import Dict, List
 
 
+# Built once: normalize_channel runs once per port per refresh, so rebuilding
+# the mapping per call is pure allocation churn. Keys and values are interned
+# so lookups and downstream equality checks are pointer comparisons, and the
+# canonical tags map to themselves so already-normalized input ("FL") hits
+# without the strip/casefold pass.
+_CHAN_MAP: Dict[str, str] = {intern(k): intern(v) for k, v in {
+    "fl": "FL", "front-left": "FL",
+    "fr": "FR", "front-right": "FR",
+    "fc": "FC", "front-center": "FC",
+    "lfe": "LFE", "low-frequency": "LFE",
+    "rl": "RL", "rear-left": "RL",
+    "rr": "RR", "rear-right": "RR",
+    "sl": "SL", "side-left": "SL",
+    "sr": "SR", "side-right": "SR",
+    "mono": "MONO",
+    "FL": "FL", "FR": "FR", "FC": "FC", "LFE": "LFE",
+    "RL": "RL", "RR": "RR", "SL": "SL", "SR": "SR", "MONO": "MONO",
+}.items()}
+
+_AUX_RE = re.compile(r"^aux(\d+)$")
+
+CHANNEL_ORDER: tuple = (
+    "MONO",
+    "FL", "FR",
+    "FC", "LFE",
+    "SL", "SR",
+    "RL", "RR",
+    "AUX0", "AUX1", "AUX2", "AUX3", "AUX4", "AUX5", "AUX6", "AUX7", "AUX8", "AUX9",
+    "AUX10", "AUX11", "AUX12", "AUX13", "AUX14", "AUX15",
+)
+
+# channel -> rank, so sorting by canonical position is a dict lookup instead
+# of a scan over the order list.
+CHANNEL_INDEX: Dict[str, int] = {c: i for i, c in enumerate(CHANNEL_ORDER)}
+
+
+def channel_sort_key(ch: str) -> int:
+    return CHANNEL_INDEX.get(ch, len(CHANNEL_ORDER))
+
+
 def canonical_channel_order() -> List[str]:
-    return [
-        "MONO",
-        "FL", "FR",
-        "FC", "LFE",
-        "SL", "SR",
-        "RL", "RR",
-        "AUX0", "AUX1", "AUX2", "AUX3", "AUX4", "AUX5", "AUX6", "AUX7", "AUX8", "AUX9",
-        "AUX10", "AUX11", "AUX12", "AUX13", "AUX14", "AUX15",
-    ]
+    return list(CHANNEL_ORDER)
 
 
 def normalize_channel(v: str) -> str:
-    s = (v or "").strip().lower()
+    if not v:
+        return ""
+
+    m = _CHAN_MAP.get(v)
+    if m:
+        return m
+
+    s = v.strip().casefold()
     if not s:
         return ""
 
-    m = {
-        "fl": "FL", "front-left": "FL",
-        "fr": "FR", "front-right": "FR",
-        "fc": "FC", "front-center": "FC",
-        "lfe": "LFE", "low-frequency": "LFE",
-        "rl": "RL", "rear-left": "RL",
-        "rr": "RR", "rear-right": "RR",
-        "sl": "SL", "side-left": "SL",
-        "sr": "SR", "side-right": "SR",
-        "mono": "MONO",
-    }
-    if s in m:
-        return m[s]
-
-    if s.startswith("aux"):
-        tail = s[3:]
-        if tail.isdigit():
-            return f"AUX{int(tail)}"
-
-    return s.upper()
+    m = _CHAN_MAP.get(s)
+    if m:
+        return m
+
+    ax = _AUX_RE.match(s)
+    if ax:
+        return intern(f"AUX{int(ax.group(1))}")
+
+    return intern(s.upper())
 
 
 def channel_from_port_props(props: Dict[str, str]) -> str:
@@ -1,32 +1,68 @@
 # pw_dump.py
 from __future__ import annotations
 
+from sys import intern
 from typing import Any, Dict, List
 
 from models import AudioNode
 from pw_channels import channel_from_port_props
-from pw_cli import pw_dump_json
+from pw_cli import pw_dump_json_with_digest
 from pw_types import PwGraph, PwLink, PwPort
 
 
+# (digest, graph) of the last parse. When the raw dump bytes are unchanged,
+# dump_graph returns the previous PwGraph object so callers can detect
+# "no change" by identity and keep their derived caches.
+_graph_cache: tuple = (None, None)
+
+
 def props_from_obj(obj: Dict[str, Any]) -> Dict[str, str]:
+    info = obj.get("info")
+    a = obj.get("props")
+    b = info.get("props") if isinstance(info, dict) else None
+    a = a if isinstance(a, dict) else {}
+    b = b if isinstance(b, dict) else {}
+    merged = {**a, **b} if b else a
+
+    # JSON keys are always strings and most values already are, so the
+    # common case is a plain copy; only numbers/bools need coercion.
     out: Dict[str, str] = {}
-    for src in (obj.get("props") or {}, (obj.get("info") or {}).get("props") or {}):
-        if not isinstance(src, dict):
-            continue
-        for k, v in src.items():
+    for k, v in merged.items():
+        if type(v) is str:
+            out[k] = v
+        elif v is None:
+            out[k] = ""
+        else:
             try:
-                ks = str(k)
+                out[k] = str(v)
             except Exception:
-                continue
-            try:
-                vs = "" if v is None else str(v)
-            except Exception:
-                vs = ""
-            out[ks] = vs
+                out[k] = ""
     return out
 
 
+def _prop(obj: Dict[str, Any], key: str) -> str:
+    # Single-key lookup with props_from_obj precedence (info.props wins),
+    # for object kinds whose full prop dict is never stored.
+    for src in ((obj.get("info") or {}).get("props"), obj.get("props")):
+        if isinstance(src, dict) and key in src:
+            v = src[key]
+            return "" if v is None else str(v)
+    return ""
+
+
+def _link_port_ids(obj: Dict[str, Any]) -> tuple:
+    # Links only ever contribute two port ids, so probe the raw prop dicts
+    # directly instead of stringifying every key/value via props_from_obj.
+    for src in ((obj.get("info") or {}).get("props"), obj.get("props")):
+        if not isinstance(src, dict):
+            continue
+        out_pid = src.get("link.output.port") or src.get("link.output.port.id")
+        in_pid = src.get("link.input.port") or src.get("link.input.port.id")
+        if out_pid is not None and in_pid is not None:
+            return out_pid, in_pid
+    return None, None
+
+
 def node_media_class(pr: Dict[str, str]) -> str:
     return pr.get("media.class", "") or ""
 
@@ -54,52 +90,91 @@ def port_direction(pr: Dict[str, str], info: Dict[str, Any]) -> str:
 
 
 def dump_graph() -> PwGraph:
-    data = pw_dump_json()
+    global _graph_cache
+
+    digest, data = pw_dump_json_with_digest()
+    cached_digest, cached_graph = _graph_cache
+    if digest == cached_digest and cached_graph is not None:
+        return cached_graph
 
     nodes: Dict[int, AudioNode] = {}
+    nodes_by_name: Dict[str, AudioNode] = {}
     ports: Dict[int, PwPort] = {}
     links: List[PwLink] = []
 
-    for obj in data:
-        if not isinstance(obj, dict):
-            continue
-        t = str(obj.get("type") or "")
-        if not t.endswith(":Node"):
-            continue
-        oid = int(obj.get("id"))
-        pr = props_from_obj(obj)
-        nodes[oid] = AudioNode(
-            id=oid,
-            name=node_name(pr),
-            description=node_desc(pr),
-            media_class=node_media_class(pr),
-            props=pr,
-        )
+    # Ports reference their owning node by id, and pw-dump does not guarantee
+    # nodes appear before their ports, so port construction is deferred until
+    # all nodes are known. Everything else is classified in a single pass.
+    pending_ports: List[tuple] = []
 
     for obj in data:
         if not isinstance(obj, dict):
             continue
         t = str(obj.get("type") or "")
-        if not t.endswith(":Port"):
-            continue
-        oid = int(obj.get("id"))
-        pr = props_from_obj(obj)
-        info = obj.get("info") or {}
+        kind = t.rpartition(":")[2]
+
+        if kind == "Node":
+            oid = int(obj.get("id"))
+            pr = props_from_obj(obj)
+            n = AudioNode(
+                id=oid,
+                name=node_name(pr),
+                description=node_desc(pr),
+                media_class=node_media_class(pr),
+                props=pr,
+            )
+            nodes[oid] = n
+            if n.name:
+                nodes_by_name[n.name] = n
+
+        elif kind == "Port":
+            pending_ports.append((int(obj.get("id")), obj))
+
+        elif kind == "Link":
+            oid = int(obj.get("id"))
+
+            out_pid, in_pid = _link_port_ids(obj)
+            if not out_pid or not in_pid:
+                continue
+            try:
+                out_i = int(out_pid)
+                in_i = int(in_pid)
+            except Exception:
+                continue
+
+            links.append(PwLink(id=oid, out_port_id=out_i, in_port_id=in_i))
 
+    ports_by_node_dir: Dict[tuple, List[PwPort]] = {}
+    # Flat id -> name map so the port loop does one dict hit per port
+    # instead of an AudioNode dereference.
+    nid2name: Dict[int, str] = {nid: n.name for nid, n in nodes.items()}
+
+    for oid, obj in pending_ports:
         try:
-            nid = int(pr.get("node.id", "0"))
+            nid = int(_prop(obj, "node.id") or "0")
         except Exception:
             nid = 0
 
-        n = nodes.get(nid)
-        nname = n.name if n else ""
-
-        pname = port_name(pr)
-        direc = port_direction(pr, info)
-        ch = channel_from_port_props(pr)
-        full = f"{nname}:{pname}" if nname and pname else ""
-
-        ports[oid] = PwPort(
+        nname = nid2name.get(nid, "")
+
+        # Ports only feed a handful of keys into PwPort, so the full
+        # props_from_obj merge is skipped in favour of targeted lookups.
+        pname = _prop(obj, "port.name")
+        # Direction, channel and owner name repeat across many ports per
+        # dump; interning collapses them to shared strings and makes the
+        # equality checks in port filtering pointer comparisons.
+        direc = intern(port_direction({"port.direction": _prop(obj, "port.direction")}, obj.get("info") or {}))
+        ch = intern(channel_from_port_props({
+            "audio.channel": _prop(obj, "audio.channel"),
+            "audio.position": _prop(obj, "audio.position"),
+            "port.name": pname,
+        }))
+        nname = intern(nname)
+        # Full names are the currency of link pairs; interning them makes
+        # the pair-set hashing and equality checks cheaper downstream.
+        full = intern(f"{nname}:{pname}") if nname and pname else ""
+
+        p = PwPort(
             id=oid,
             node_id=nid,
             node_name=nname,
@@ -108,26 +183,26 @@ def dump_graph() -> PwGraph:
             channel=ch,
             full_name=full,
         )
-
-    for obj in data:
-        if not isinstance(obj, dict):
-            continue
-        t = str(obj.get("type") or "")
-        if not t.endswith(":Link"):
-            continue
-        oid = int(obj.get("id"))
-        pr = props_from_obj(obj)
-
-        out_pid = pr.get("link.output.port") or pr.get("link.output.port.id")
-        in_pid = pr.get("link.input.port") or pr.get("link.input.port.id")
-        if not out_pid or not in_pid:
-            continue
-        try:
-            out_i = int(out_pid)
-            in_i = int(in_pid)
-        except Exception:
-            continue
-
-        links.append(PwLink(id=oid, out_port_id=out_i, in_port_id=in_i))
-
-    return PwGraph(nodes=nodes, ports=ports, links=links)
+        ports[oid] = p
+        # Only linkable ports (with a resolvable full name) enter the
+        # selection index; link resolution still sees every port via `ports`.
+        if full:
+            ports_by_node_dir.setdefault((nid, direc), []).append(p)
+
+    link_name_pairs = set()
+    for lk in links:
+        op = ports.get(lk.out_port_id)
+        ip = ports.get(lk.in_port_id)
+        if op and ip and op.full_name and ip.full_name:
+            link_name_pairs.add((op.full_name, ip.full_name))
+
+    graph = PwGraph(
+        nodes=nodes,
+        ports=ports,
+        links=links,
+        ports_by_node_dir=ports_by_node_dir,
+        nodes_by_name=nodes_by_name,
+        link_name_pairs=frozenset(link_name_pairs),
+    )
+    _graph_cache = (digest, graph)
+    return graph
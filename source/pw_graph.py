@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Dict, List, Tuple
 
 from models import AudioNode
-from pw_channels import canonical_channel_order
+from pw_channels import CHANNEL_INDEX, channel_sort_key
 from pw_types import PwGraph, PwPort
 
 
@@ -25,13 +25,16 @@ def is_monitor_node(n: AudioNode) -> bool:
     return n.name.endswith(".monitor") or n.props.get("node.name", "").endswith(".monitor")
 
 
+_INTERNAL_APPS = frozenset({"PipeWire", "WirePlumber", "PulseAudio"})
+
+
 def is_internal_node(n: AudioNode) -> bool:
-    app = (n.props.get("application.name") or "").strip()
-    return app in ("PipeWire", "WirePlumber", "PulseAudio")
+    app = n.props.get("application.name")
+    return bool(app) and app.strip() in _INTERNAL_APPS
 
 
 def select_ports(graph: PwGraph, node_id: int, direction: str) -> List[PwPort]:
-    ps = [p for p in graph.ports.values() if p.node_id == node_id and p.direction == direction and p.full_name]
+    ps = graph.ports_by_node_dir.get((node_id, direction))
     if not ps:
         return []
 
@@ -41,13 +44,11 @@ def select_ports(graph: PwGraph, node_id: int, direction: str) -> List[PwPort]:
             by_ch[p.channel] = p
 
     if by_ch:
-        out: List[PwPort] = []
-        used: set[int] = set()
-        for ch in canonical_channel_order():
-            p = by_ch.get(ch)
-            if p:
-                out.append(p)
-                used.add(p.id)
+        # Sort the channels we actually have by canonical rank instead of
+        # walking the full canonical order per call.
+        known = [ch for ch in by_ch if ch in CHANNEL_INDEX]
+        out: List[PwPort] = [by_ch[ch] for ch in sorted(known, key=channel_sort_key)]
+        used: set[int] = {p.id for p in out}
         for p in sorted(ps, key=lambda x: x.id):
             if p.id not in used:
                 out.append(p)
@@ -64,10 +65,9 @@ def map_ports_1_to_1(src: List[PwPort], dst: List[PwPort]) -> List[Tuple[str, st
     d_by = {p.channel: p for p in dst if p.channel}
 
     if s_by and d_by:
-        pairs: List[Tuple[str, str]] = []
-        for ch in canonical_channel_order():
-            if ch in s_by and ch in d_by:
-                pairs.append((s_by[ch].full_name, d_by[ch].full_name))
+        common = [ch for ch in s_by.keys() & d_by.keys() if ch in CHANNEL_INDEX]
+        common.sort(key=channel_sort_key)
+        pairs: List[Tuple[str, str]] = [(s_by[ch].full_name, d_by[ch].full_name) for ch in common]
         if pairs:
             return pairs
 
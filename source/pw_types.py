@@ -1,13 +1,13 @@
 # pw_types.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple
 
 from models import AudioNode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PwPort:
     id: int
     node_id: int
@@ -18,15 +18,23 @@ class PwPort:
     full_name: str  # "node.name:port.name" or ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PwLink:
     id: int
     out_port_id: int
     in_port_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PwGraph:
     nodes: Dict[int, AudioNode]
     ports: Dict[int, PwPort]
     links: List[PwLink]
+    # (node_id, direction) -> linkable ports, built once at dump time so
+    # per-node queries don't rescan or re-filter every port in the graph.
+    ports_by_node_dir: Dict[Tuple[int, str], List[PwPort]] = field(default_factory=dict)
+    # node.name -> node, for O(1) lookups (e.g. the hub sink by name).
+    nodes_by_name: Dict[str, AudioNode] = field(default_factory=dict)
+    # (out full_name, in full_name) for every resolved link, so link
+    # existence checks don't rebuild the set per call.
+    link_name_pairs: FrozenSet[Tuple[str, str]] = frozenset()
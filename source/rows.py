@@ -14,9 +14,27 @@ from widgets import ToggleSwitch, ElideComboBox, StatusPill
 LinkPairs = List[Tuple[str, str]]
 
 
-class InputRow(QWidget):
+class _RowBase(QWidget):
+    """Shared skeleton for input and output rows.
+
+    Subclasses only define what a selection is and how to connect it:
+    _selected_target() returns a comparable key for the current selection
+    (or None), and _connect_target() performs the backend connect for that
+    key, returning the created pairs and the status tooltip.
+    """
+
     remove_requested = Signal(QWidget)
 
+    # Pill rendering per state (0=off, 1=on, 2=pending, 3=error) as
+    # (text, pill state, tooltip). A None tooltip means "leave as-is":
+    # apply() sets the link tip for On, and Error carries its message.
+    _STATE_TABLE = (
+        ("Off", "off", ""),
+        ("On", "on", None),
+        ("Pending", "pending", "Pending changes (Apply to commit)."),
+        ("Error", "error", None),
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.setObjectName("RowCard")
@@ -31,14 +49,17 @@ class InputRow(QWidget):
         self.remove_btn.setObjectName("Remove")
         self.remove_btn.setFixedSize(32, 28)
         self.remove_btn.setCursor(Qt.PointingHandCursor)
-        self.remove_btn.clicked.connect(lambda: self.remove_requested.emit(self))
+        self.remove_btn.clicked.connect(self._emit_remove)
 
-        self._applied_choice_key: Optional[str] = None
+        self._applied_target: Optional[object] = None
         self._pairs: LinkPairs = []
         self._actual_on = False
 
         self._remove_pending = False
         self._error: Optional[str] = None
+        self._last_reconcile_sig: Optional[tuple] = None
+        self._last_remove_state: Optional[bool] = None
+        self._last_status: Optional[tuple] = None
 
         row = QHBoxLayout()
         row.setContentsMargins(10, 8, 10, 8)
@@ -49,35 +70,48 @@ class InputRow(QWidget):
         row.addWidget(self.remove_btn, 0, Qt.AlignVCenter)
         self.setLayout(row)
 
-        self.switch.toggled.connect(lambda _v: self._on_user_change())
-        self.combo.currentIndexChanged.connect(lambda _i: self._on_user_change())
+        self.switch.toggled.connect(self._on_user_change)
+        self.combo.currentIndexChanged.connect(self._on_user_change)
         self._sync_ui()
 
-    def _on_user_change(self) -> None:
+    # --- subclass hooks -------------------------------------------------
+
+    def _selected_target(self) -> Optional[object]:
+        raise NotImplementedError
+
+    def _connect_target(self, backend: PipeWireHubBackend, target) -> Tuple[LinkPairs, str]:
+        raise NotImplementedError
+
+    # --- shared behaviour -----------------------------------------------
+
+    def _emit_remove(self) -> None:
+        self.remove_requested.emit(self)
+
+    def _on_user_change(self, *_args) -> None:
         self._error = None
+        self._last_reconcile_sig = None
         self._sync_ui()
 
     def toggle_remove_pending(self) -> None:
         self._remove_pending = not self._remove_pending
         self._error = None
+        self._last_reconcile_sig = None
         self._sync_ui()
 
-    def selected_choice(self) -> Optional[InputChoice]:
-        d = self.combo.currentData()
-        return d if isinstance(d, InputChoice) else None
-
     def _desired_on(self) -> bool:
         return bool(self.switch.isChecked()) and not self._remove_pending
 
-    def _sel_key(self) -> Optional[str]:
-        c = self.selected_choice()
-        return c.key if c else None
-
-    def reconcile(self, backend: PipeWireHubBackend) -> None:
+    def reconcile(self, backend: PipeWireHubBackend, sig: Optional[tuple] = None) -> None:
+        # Periodic callers pass a snapshot signature; when it matches the
+        # last reconciled one nothing can have changed, so the pair check
+        # and pill re-render are skipped.
+        if sig is not None and sig == self._last_reconcile_sig:
+            return
         try:
             self._actual_on = bool(self._pairs) and backend.pairs_exist(self._pairs, refresh=False)
         except Exception:
             self._actual_on = False
+        self._last_reconcile_sig = sig
         self._sync_ui()
 
     def _is_pending(self) -> bool:
@@ -87,44 +121,52 @@ class InputRow(QWidget):
         if d != a:
             return True
         if d and a:
-            sk = self._sel_key()
-            return (sk is None) or (self._applied_choice_key != sk)
+            sel = self._selected_target()
+            return (sel is None) or (sel != self._applied_target)
         return False
 
     def _sync_ui(self) -> None:
-        if self._remove_pending:
-            self.remove_btn.setObjectName("RemovePending")
-            self.remove_btn.setToolTip("Pending removal (Apply to remove).")
-            self.combo.setEnabled(False)
-            self.switch.setEnabled(False)
-        else:
-            self.remove_btn.setObjectName("Remove")
-            self.remove_btn.setToolTip("Remove row (pending until Apply).")
-            self.combo.setEnabled(True)
-            self.switch.setEnabled(True)
-
-        self.remove_btn.style().unpolish(self.remove_btn)
-        self.remove_btn.style().polish(self.remove_btn)
-
-        if self._error is not None:
-            self.status.setText("Error")
-            self.status.set_state("error")
-            self.status.setToolTip(self._error)
-            return
-
-        if self._is_pending():
-            self.status.setText("Pending")
-            self.status.set_state("pending")
-            self.status.setToolTip("Pending changes (Apply to commit).")
+        # unpolish/polish re-applies the stylesheet to the button; only pay
+        # for it when the remove state actually flipped.
+        if self._remove_pending != self._last_remove_state:
+            self._last_remove_state = self._remove_pending
+            if self._remove_pending:
+                self.remove_btn.setObjectName("RemovePending")
+                self.remove_btn.setToolTip("Pending removal (Apply to remove).")
+                self.combo.setEnabled(False)
+                self.switch.setEnabled(False)
+            else:
+                self.remove_btn.setObjectName("Remove")
+                self.remove_btn.setToolTip("Remove row (pending until Apply).")
+                self.combo.setEnabled(True)
+                self.switch.setEnabled(True)
+
+            self.remove_btn.style().unpolish(self.remove_btn)
+            self.remove_btn.style().polish(self.remove_btn)
+
+        # The pill setters dirty and repaint the widget; compute the target
+        # (text, state, tooltip) first and bail out when it already shows
+        # that.
+        state = (
+            3 if self._error is not None
+            else 2 if self._is_pending()
+            else 1 if self._actual_on
+            else 0
+        )
+        text, pill, tip = self._STATE_TABLE[state]
+        if state == 3:
+            tip = self._error
+        target = (text, pill, tip)
+
+        if target == self._last_status:
             return
+        self._last_status = target
 
-        if self._actual_on:
-            self.status.setText("On")
-            self.status.set_state("on")
-        else:
-            self.status.setText("Off")
-            self.status.set_state("off")
-            self.status.setToolTip("")
+        text, state, tip = target
+        self.status.setText(text)
+        self.status.set_state(state)
+        if tip is not None:
+            self.status.setToolTip(tip)
 
     def disconnect_now(self, backend: PipeWireHubBackend) -> None:
         try:
@@ -133,7 +175,7 @@ class InputRow(QWidget):
             pass
         self._pairs = []
         self._actual_on = False
-        self._applied_choice_key = None
+        self._applied_target = None
         self._error = None
         self._remove_pending = False
         self._sync_ui()
@@ -148,7 +190,7 @@ class InputRow(QWidget):
                 pass
             self._pairs = []
             self._actual_on = False
-            self._applied_choice_key = None
+            self._applied_target = None
             self._sync_ui()
             return True
 
@@ -160,18 +202,17 @@ class InputRow(QWidget):
                     pass
             self._pairs = []
             self._actual_on = False
-            self._applied_choice_key = None
+            self._applied_target = None
             self._sync_ui()
             return False
 
-        choice = self.selected_choice()
-        if choice is None:
+        target = self._selected_target()
+        if target is None:
             self._error = "No selection."
             self._sync_ui()
             return False
 
-        sel_key = choice.key
-        needs = (not self._actual_on) or (self._applied_choice_key != sel_key)
+        needs = (not self._actual_on) or (self._applied_target != target)
         if not needs:
             self._sync_ui()
             return False
@@ -183,90 +224,61 @@ class InputRow(QWidget):
                 pass
         self._pairs = []
         self._actual_on = False
-        self._applied_choice_key = None
+        self._applied_target = None
 
         try:
-            kind = choice.kind
-            node_id = int(sel_key.split(":", 1)[1])
-
-            if kind == "stream":
-                pairs = backend.connect_stream_to_hub(node_id)
-                tip = "PipeWire links: stream outputs → aSyphon inputs."
-            elif kind == "source":
-                pairs = backend.connect_source_to_hub(node_id)
-                tip = "PipeWire links: source outputs → aSyphon inputs."
-            elif kind == "sink":
-                pairs = backend.connect_sink_tap_to_hub(node_id)
-                tip = "PipeWire links: sink monitor outputs → aSyphon inputs."
-            else:
-                raise RuntimeError("Unknown input kind.")
-
+            pairs, tip = self._connect_target(backend, target)
             self._pairs = pairs
             self._actual_on = True
-            self._applied_choice_key = sel_key
+            self._applied_target = target
             self.status.setToolTip(tip)
         except Exception as e:
             self._pairs = []
             self._actual_on = False
-            self._applied_choice_key = None
+            self._applied_target = None
             self._error = str(e)
 
         self._sync_ui()
         return False
 
 
-class OutputRow(QWidget):
-    remove_requested = Signal(QWidget)
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.setObjectName("RowCard")
-
-        self.combo = ElideComboBox()
-        self.combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-
-        self.switch = ToggleSwitch()
-        self.status = StatusPill()
-
-        self.remove_btn = QPushButton("✕")
-        self.remove_btn.setObjectName("Remove")
-        self.remove_btn.setFixedSize(32, 28)
-        self.remove_btn.setCursor(Qt.PointingHandCursor)
-        self.remove_btn.clicked.connect(lambda: self.remove_requested.emit(self))
-
-        self._applied_sink_id: Optional[int] = None
-        self._pairs: LinkPairs = []
-        self._actual_on = False
-
-        self._remove_pending = False
-        self._error: Optional[str] = None
-
-        row = QHBoxLayout()
-        row.setContentsMargins(10, 8, 10, 8)
-        row.setSpacing(10)
-        row.addWidget(self.combo, 1)
-        row.addWidget(self.status, 0, Qt.AlignVCenter)
-        row.addWidget(self.switch, 0, Qt.AlignVCenter)
-        row.addWidget(self.remove_btn, 0, Qt.AlignVCenter)
-        self.setLayout(row)
-
-        self.switch.toggled.connect(lambda _v: self._on_user_change())
-        self.combo.currentIndexChanged.connect(lambda _i: self._on_user_change())
-        self._sync_ui()
-
-    def _on_user_change(self) -> None:
-        self._error = None
-        self._sync_ui()
+class InputRow(_RowBase):
+    def selected_choice(self) -> Optional[InputChoice]:
+        d = self.combo.currentData()
+        return d if isinstance(d, InputChoice) else None
 
-    def toggle_remove_pending(self) -> None:
-        self._remove_pending = not self._remove_pending
-        self._error = None
-        self._sync_ui()
+    def _selected_target(self) -> Optional[str]:
+        c = self.selected_choice()
+        return c.key if c else None
 
-    def _desired_on(self) -> bool:
-        return bool(self.switch.isChecked()) and not self._remove_pending
+    def _connect_target(self, backend: PipeWireHubBackend, target: str) -> Tuple[LinkPairs, str]:
+        choice = self.selected_choice()
+        kind = choice.kind if choice is not None else ""
+        node_id = int(target.split(":", 1)[1])
+
+        if kind == "stream":
+            return (
+                backend.connect_stream_to_hub(node_id),
+                "PipeWire links: stream outputs → aSyphon inputs.",
+            )
+        if kind == "source":
+            return (
+                backend.connect_source_to_hub(node_id),
+                "PipeWire links: source outputs → aSyphon inputs.",
+            )
+        if kind == "sink":
+            return (
+                backend.connect_sink_tap_to_hub(node_id),
+                "PipeWire links: sink monitor outputs → aSyphon inputs.",
+            )
+        raise RuntimeError("Unknown input kind.")
+
+
+class OutputRow(_RowBase):
+    def selected_sink_node_id(self) -> Optional[int]:
+        return self._selected_target()
 
-    def _selected_sink_id(self) -> Optional[int]:
+    def _selected_target(self) -> Optional[int]:
         d = self.combo.currentData()
         if not isinstance(d, str) or not d.startswith("sink:"):
             return None
@@ -275,130 +287,8 @@ class OutputRow(QWidget):
         except Exception:
             return None
 
-    def selected_sink_node_id(self) -> Optional[int]:
-        return self._selected_sink_id()
-
-    def reconcile(self, backend: PipeWireHubBackend) -> None:
-        try:
-            self._actual_on = bool(self._pairs) and backend.pairs_exist(self._pairs, refresh=False)
-        except Exception:
-            self._actual_on = False
-        self._sync_ui()
-
-    def _is_pending(self) -> bool:
-        if self._remove_pending:
-            return True
-        d, a = self._desired_on(), self._actual_on
-        if d != a:
-            return True
-        if d and a:
-            sel = self._selected_sink_id()
-            return (sel is None) or (sel != self._applied_sink_id)
-        return False
-
-    def _sync_ui(self) -> None:
-        if self._remove_pending:
-            self.remove_btn.setObjectName("RemovePending")
-            self.remove_btn.setToolTip("Pending removal (Apply to remove).")
-            self.combo.setEnabled(False)
-            self.switch.setEnabled(False)
-        else:
-            self.remove_btn.setObjectName("Remove")
-            self.remove_btn.setToolTip("Remove row (pending until Apply).")
-            self.combo.setEnabled(True)
-            self.switch.setEnabled(True)
-
-        self.remove_btn.style().unpolish(self.remove_btn)
-        self.remove_btn.style().polish(self.remove_btn)
-
-        if self._error is not None:
-            self.status.setText("Error")
-            self.status.set_state("error")
-            self.status.setToolTip(self._error)
-            return
-
-        if self._is_pending():
-            self.status.setText("Pending")
-            self.status.set_state("pending")
-            self.status.setToolTip("Pending changes (Apply to commit).")
-            return
-
-        if self._actual_on:
-            self.status.setText("On")
-            self.status.set_state("on")
-        else:
-            self.status.setText("Off")
-            self.status.set_state("off")
-            self.status.setToolTip("")
-
-    def disconnect_now(self, backend: PipeWireHubBackend) -> None:
-        try:
-            backend.disconnect_pairs(self._pairs)
-        except Exception:
-            pass
-        self._pairs = []
-        self._actual_on = False
-        self._applied_sink_id = None
-        self._error = None
-        self._remove_pending = False
-        self._sync_ui()
-
-    def apply(self, backend: PipeWireHubBackend) -> bool:
-        self._error = None
-
-        if self._remove_pending:
-            try:
-                backend.disconnect_pairs(self._pairs)
-            except Exception:
-                pass
-            self._pairs = []
-            self._actual_on = False
-            self._applied_sink_id = None
-            self._sync_ui()
-            return True
-
-        if not self._desired_on():
-            if self._pairs:
-                try:
-                    backend.disconnect_pairs(self._pairs)
-                except Exception:
-                    pass
-            self._pairs = []
-            self._actual_on = False
-            self._applied_sink_id = None
-            self._sync_ui()
-            return False
-
-        sink_id = self._selected_sink_id()
-        if sink_id is None:
-            self._error = "No selection."
-            self._sync_ui()
-            return False
-
-        needs = (not self._actual_on) or (sink_id != self._applied_sink_id)
-        if not needs:
-            self._sync_ui()
-            return False
-
-        if self._pairs:
-            try:
-                backend.disconnect_pairs(self._pairs)
-            except Exception:
-                pass
-        self._pairs = []
-        self._actual_on = False
-        self._applied_sink_id = None
-
-        try:
-            self._pairs = backend.connect_hub_to_sink(sink_id)
-            self._actual_on = True
-            self._applied_sink_id = sink_id
-            self.status.setToolTip("PipeWire links: aSyphon monitor outputs → sink inputs.")
-        except Exception as e:
-            self._pairs = []
-            self._actual_on = False
-            self._applied_sink_id = None
-            self._error = str(e)
-
-        self._sync_ui()
-        return False
+    def _connect_target(self, backend: PipeWireHubBackend, target: int) -> Tuple[LinkPairs, str]:
+        return (
+            backend.connect_hub_to_sink(target),
+            "PipeWire links: aSyphon monitor outputs → sink inputs.",
+        )
@@ -5,7 +5,8 @@ import configparser
 import os
 import platform
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -18,7 +19,11 @@ custom_path =
 last_exe_path =
 """
 
+# Encoded once at import; ensure_exists writes these bytes directly.
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TEXT.encode("utf-8")
 
+
+@lru_cache(maxsize=None)
 def _windows_appdata_dir() -> Path:
     appdata = os.environ.get("APPDATA")
     if appdata:
@@ -26,6 +31,7 @@ def _windows_appdata_dir() -> Path:
     return Path.home() / "AppData" / "Roaming"
 
 
+@lru_cache(maxsize=None)
 def _linux_xdg_config_dir() -> Path:
     xdg = os.environ.get("XDG_CONFIG_HOME")
     if xdg:
@@ -33,7 +39,10 @@ def _linux_xdg_config_dir() -> Path:
     return Path.home() / ".config"
 
 
+@lru_cache(maxsize=None)
 def user_config_dir(app_name: str) -> Path:
+    # The platform and environment do not change while the app runs, and
+    # this is hit on every config path lookup; cache per app name.
     sysname = (platform.system() or "").lower()
     if sysname.startswith("windows"):
         return _windows_appdata_dir() / app_name
@@ -57,50 +66,74 @@ def detect_executable_path() -> str:
         return ""
 
 
-def _read_last_exe_path_from_cfg(cfg_path: Path) -> str:
+def _read_last_exe_path_from_cfg(cfg_path: "str | Path") -> str:
+    # resink.cfg has a tiny fixed schema and only one key matters here, so
+    # a section-aware line scan replaces the full ConfigParser machinery.
+    # Callers pass paths they have already seen in a directory listing, so
+    # there is no pre-flight exists() stat; a vanished file just reads as
+    # empty.
     try:
-        if not cfg_path.exists():
-            return ""
-        cfg = configparser.ConfigParser()
-        cfg.read(cfg_path, encoding="utf-8")
-        if not cfg.has_section("App"):
-            return ""
-        p = cfg.get("App", "last_exe_path", fallback="").strip()
-        if not p:
-            return ""
-        pp = Path(p).expanduser()
-        return str(pp) if pp.exists() else ""
+        with open(cfg_path, "r", encoding="utf-8") as f:
+            in_app = False
+            for line in f:
+                s = line.strip()
+                if s.startswith("["):
+                    in_app = s.lower() == "[app]"
+                    continue
+                if not in_app or "=" not in s:
+                    continue
+                k, _, v = s.partition("=")
+                if k.strip() != "last_exe_path":
+                    continue
+                p = v.strip()
+                if not p:
+                    return ""
+                pp = Path(p).expanduser()
+                return str(pp) if pp.exists() else ""
     except Exception:
-        return ""
+        pass
+    return ""
 
 
+@lru_cache(maxsize=1)
 def find_resink_executable_path() -> str:
     """
     I detect reSink by locating reSink's own config, then reading [App]/last_exe_path.
 
+    The result is cached (several stats and a config parse per probe);
+    callers that just failed to find reSink call cache_clear() so the next
+    attempt re-probes the disk.
+
     I try:
       - Linux:  $XDG_CONFIG_HOME/reSink/resink.cfg  (or ~/.config/reSink/resink.cfg)
       - Windows: %APPDATA%\\reSink\\resink.cfg
     and case variants for directory/filename.
     """
-    candidates: list[Path] = []
     for app_dir in ("reSink", "resink"):
         d = user_config_dir(app_dir)
-        candidates.append(d / "resink.cfg")
-        candidates.append(d / "reSink.cfg")
-
-    for p in candidates:
-        exe = _read_last_exe_path_from_cfg(p)
-        if exe:
-            return exe
+        # One scandir per directory covers every case variant of the
+        # filename, instead of stat-ing each candidate path individually.
+        try:
+            with os.scandir(d) as it:
+                found = [e.path for e in it if e.name.lower() == "resink.cfg"]
+        except OSError:
+            continue
+        for p in found:
+            exe = _read_last_exe_path_from_cfg(p)
+            if exe:
+                return exe
 
     return ""
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ConfigStore:
     app_name: str = "aSyphon"
     filename: str = "asyphon.cfg"
+    # Parser from the last load/save plus the (st_mtime_ns, st_size) stamp
+    # of the file it came from; load() skips the reparse while they match.
+    _cached_cfg: "configparser.ConfigParser | None" = field(default=None, repr=False, compare=False)
+    _cached_stat: "tuple[int, int] | None" = field(default=None, repr=False, compare=False)
 
     @property
     def dir_path(self) -> Path:
@@ -112,11 +145,30 @@ class ConfigStore:
 
     def ensure_exists(self) -> None:
         self.dir_path.mkdir(parents=True, exist_ok=True)
-        if not self.file_path.exists():
-            self.file_path.write_text(DEFAULT_CONFIG_TEXT, encoding="utf-8")
+        # "x" mode creates the default config only when it is missing,
+        # which saves the exists() stat on the common warm-start path.
+        try:
+            with self.file_path.open("xb") as f:
+                f.write(_DEFAULT_CONFIG_BYTES)
+        except FileExistsError:
+            pass
+
+    def _stat_stamp(self) -> "tuple[int, int] | None":
+        try:
+            st = os.stat(self.file_path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
 
     def load(self) -> configparser.ConfigParser:
         self.ensure_exists()
+
+        stamp = self._stat_stamp()
+        if stamp is not None and stamp == self._cached_stat and self._cached_cfg is not None:
+            # Callers only mutate the parser immediately before save(),
+            # which restamps the cache, so the shared instance stays valid.
+            return self._cached_cfg
+
         cfg = configparser.ConfigParser()
         cfg.read(self.file_path, encoding="utf-8")
 
@@ -129,20 +181,29 @@ class ConfigStore:
             cfg.add_section("App")
         cfg.set("App", "last_exe_path", cfg.get("App", "last_exe_path", fallback=""))
 
+        self._cached_cfg = cfg
+        self._cached_stat = stamp
         return cfg
 
     def save(self, cfg: configparser.ConfigParser) -> None:
-        self.ensure_exists()
-        with self.file_path.open("w", encoding="utf-8") as f:
+        self.dir_path.mkdir(parents=True, exist_ok=True)
+        # Write a sibling temp file and rename it over the target, so a
+        # crash mid-write can never leave a truncated config behind.
+        tmp = self.file_path.with_suffix(".cfg.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
             cfg.write(f)
+        os.replace(tmp, self.file_path)
+        self._cached_cfg = cfg
+        self._cached_stat = self._stat_stamp()
 
     def record_last_exe_path(self) -> None:
-        cfg = self.load()
+        # Resolve our own path first: when it is unknown there is nothing to
+        # record and the config is never touched.
         p = detect_executable_path().strip()
         if not p:
             return
-        if not cfg.has_section("App"):
-            cfg.add_section("App")
-        if cfg.get("App", "last_exe_path", fallback="").strip() != p:
-            cfg.set("App", "last_exe_path", p)
-            self.save(cfg)
+        cfg = self.load()
+        if cfg.get("App", "last_exe_path", fallback="").strip() == p:
+            return
+        cfg.set("App", "last_exe_path", p)
+        self.save(cfg)
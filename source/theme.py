@@ -5,26 +5,9 @@ from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QApplication
 
 
-def apply_dark_theme(app: QApplication) -> None:
-    app.setStyle("Fusion")
-
-    pal = QPalette()
-    pal.setColor(QPalette.Window, QColor(20, 20, 22))
-    pal.setColor(QPalette.WindowText, QColor(230, 230, 230))
-    pal.setColor(QPalette.Base, QColor(14, 14, 16))
-    pal.setColor(QPalette.AlternateBase, QColor(26, 26, 28))
-    pal.setColor(QPalette.Text, QColor(230, 230, 230))
-    pal.setColor(QPalette.Button, QColor(34, 34, 38))
-    pal.setColor(QPalette.ButtonText, QColor(230, 230, 230))
-    pal.setColor(QPalette.Highlight, QColor(80, 110, 170))
-    pal.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-    pal.setColor(QPalette.Disabled, QPalette.Text, QColor(140, 140, 140))
-    pal.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(140, 140, 140))
-    pal.setColor(QPalette.Disabled, QPalette.WindowText, QColor(140, 140, 140))
-    app.setPalette(pal)
-
-    app.setStyleSheet(
-        """
+# The application stylesheet, bound once at import so apply_dark_theme just
+# hands Qt a ready string.
+_QSS = """
         QMainWindow { background: #141416; }
 
         QLabel#Title {
@@ -101,4 +84,32 @@ def apply_dark_theme(app: QApplication) -> None:
         }
         QPushButton#PendingAction:hover { background: #453f2c; }
         """
-    )
+
+
+# Palette roles and their colors, with the QColor objects built once at
+# import. Three-element entries carry a color group (the disabled shades).
+_PALETTE_SPEC = (
+    (QPalette.Window, QColor(20, 20, 22)),
+    (QPalette.WindowText, QColor(230, 230, 230)),
+    (QPalette.Base, QColor(14, 14, 16)),
+    (QPalette.AlternateBase, QColor(26, 26, 28)),
+    (QPalette.Text, QColor(230, 230, 230)),
+    (QPalette.Button, QColor(34, 34, 38)),
+    (QPalette.ButtonText, QColor(230, 230, 230)),
+    (QPalette.Highlight, QColor(80, 110, 170)),
+    (QPalette.HighlightedText, QColor(255, 255, 255)),
+    (QPalette.Disabled, QPalette.Text, QColor(140, 140, 140)),
+    (QPalette.Disabled, QPalette.ButtonText, QColor(140, 140, 140)),
+    (QPalette.Disabled, QPalette.WindowText, QColor(140, 140, 140)),
+)
+
+
+def apply_dark_theme(app: QApplication) -> None:
+    app.setStyle("Fusion")
+
+    pal = QPalette()
+    for entry in _PALETTE_SPEC:
+        pal.setColor(*entry)
+    app.setPalette(pal)
+
+    app.setStyleSheet(_QSS)
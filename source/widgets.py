@@ -1,7 +1,7 @@
 # widgets.py
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QRectF, QEasingCurve, QPropertyAnimation, Property, QSize
+from PySide6.QtCore import Qt, QEvent, QRectF, QEasingCurve, QPropertyAnimation, Property, QSize
 from PySide6.QtGui import QPainter, QColor, QFontMetrics, QPen
 from PySide6.QtWidgets import QAbstractButton, QComboBox, QStyle, QStyleOptionComboBox, QLabel
 
@@ -26,6 +26,15 @@ class ToggleSwitch(QAbstractButton):
         self._offset = 1.0 if self.isChecked() else 0.0
         self.setFixedSize(46, 24)
 
+        # The size is fixed, so the frame rect, corner radius, pen and knob
+        # travel never change; compute them once instead of per paint frame.
+        self._pen = QPen(self._border, 1.0)
+        self._rect = QRectF(0.5, 0.5, self.width() - 1.0, self.height() - 1.0)
+        self._rad = self._rect.height() / 2.0
+        self._knob_d = self._rect.height() - 2 * 3.0
+        self._knob_span = self._rect.width() - 2 * 3.0 - self._knob_d
+        self._last_px = -1
+
     def sizeHint(self) -> QSize:
         return QSize(46, 24)
 
@@ -40,7 +49,12 @@ class ToggleSwitch(QAbstractButton):
 
     def set_offset(self, v: float) -> None:
         self._offset = float(v)
-        self.update()
+        # The easing curve emits many values that land on the same knob
+        # pixel; only schedule a repaint when the knob visibly moves.
+        px = int(self._offset * self._knob_span)
+        if px != self._last_px:
+            self._last_px = px
+            self.update()
 
     offset = Property(float, get_offset, set_offset)
 
@@ -48,18 +62,14 @@ class ToggleSwitch(QAbstractButton):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
 
-        r = QRectF(0.5, 0.5, self.width() - 1.0, self.height() - 1.0)
-        rad = r.height() / 2.0
-
-        bg = self._on_bg if self.isChecked() else self._off_bg
-        p.setPen(QPen(self._border, 1.0))
-        p.setBrush(bg)
-        p.drawRoundedRect(r, rad, rad)
+        r = self._rect
+        p.setPen(self._pen)
+        p.setBrush(self._on_bg if self.isChecked() else self._off_bg)
+        p.drawRoundedRect(r, self._rad, self._rad)
 
-        m = 3.0
-        d = r.height() - 2 * m
-        x = r.x() + m + self._offset * (r.width() - 2 * m - d)
-        knob = QRectF(x, r.y() + m, d, d)
+        d = self._knob_d
+        x = r.x() + 3.0 + self._offset * self._knob_span
+        knob = QRectF(x, r.y() + 3.0, d, d)
 
         p.setPen(Qt.NoPen)
         p.setBrush(self._knob)
@@ -72,14 +82,31 @@ class ElideComboBox(QComboBox):
         super().__init__(parent)
         self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         self.setMinimumContentsLength(12)
+        # (text, available width) -> elided text of the last paint. Eliding
+        # measures (shapes) the string, so repaints from hover/focus with
+        # the same text and width reuse the previous result.
+        self._elide_key: tuple = ("", -1)
+        self._elided = ""
+        # Font metrics are refreshed from changeEvent on font changes, so
+        # paints never have to query the font engine for a new instance.
+        self._fm = QFontMetrics(self.font())
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.FontChange:
+            self._fm = QFontMetrics(self.font())
+            self._elide_key = ("", -1)
+        super().changeEvent(event)
 
     def paintEvent(self, _event) -> None:
         opt = QStyleOptionComboBox()
         self.initStyleOption(opt)
 
-        fm = QFontMetrics(opt.fontMetrics)
         w = max(10, self.rect().width() - 38)
-        opt.currentText = fm.elidedText(opt.currentText, Qt.ElideRight, w)
+        key = (opt.currentText, w)
+        if key != self._elide_key:
+            self._elide_key = key
+            self._elided = self._fm.elidedText(opt.currentText, Qt.ElideRight, w)
+        opt.currentText = self._elided
 
         p = QPainter(self)
         self.style().drawComplexControl(QStyle.CC_ComboBox, opt, p, self)
@@ -88,25 +115,11 @@ class ElideComboBox(QComboBox):
 
 
 class StatusPill(QLabel):
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        self.setAlignment(Qt.AlignCenter)
-        self.setFixedWidth(90)
-        self.setText("Off")
-        self.set_state("off")
-
-    def set_state(self, state: str) -> None:
-        if state == "on":
-            bg, bd, fg = "#233a2c", "#2f6b45", "#cfeedd"
-        elif state == "pending":
-            bg, bd, fg = "#3a3424", "#7a6231", "#f3e6c8"
-        elif state == "error":
-            bg, bd, fg = "#3a2424", "#7a3131", "#f3c8c8"
-        else:
-            bg, bd, fg = "#2a2a30", "#3a3a42", "#d6d6d6"
-
-        self.setStyleSheet(
-            f"""
+    # One fully formatted stylesheet per state, built once at class
+    # creation; set_state becomes a dict lookup instead of an f-string
+    # build, and setStyleSheet (which repolishes the widget) only runs
+    # when the state actually changes.
+    _STYLE_FMT = """
             QLabel {{
                 background: {bg};
                 border: 1px solid {bd};
@@ -116,4 +129,25 @@ class StatusPill(QLabel):
                 font-weight: 600;
             }}
             """
-        )
+    _STYLES = {
+        "on": _STYLE_FMT.format(bg="#233a2c", bd="#2f6b45", fg="#cfeedd"),
+        "pending": _STYLE_FMT.format(bg="#3a3424", bd="#7a6231", fg="#f3e6c8"),
+        "error": _STYLE_FMT.format(bg="#3a2424", bd="#7a3131", fg="#f3c8c8"),
+        "off": _STYLE_FMT.format(bg="#2a2a30", bd="#3a3a42", fg="#d6d6d6"),
+    }
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.setFixedWidth(90)
+        self.setText("Off")
+        self._state = ""
+        self.set_state("off")
+
+    def set_state(self, state: str) -> None:
+        if state not in self._STYLES:
+            state = "off"
+        if state == self._state:
+            return
+        self._state = state
+        self.setStyleSheet(self._STYLES[state])